@@ -4,6 +4,7 @@ grammar scheme;
 root: expr*;
 
 expr: '(' 'define' definition ')'               # DefinitionExpr
+    | '(' 'import' STRING ID? ')'               # ImportExpr
     | '(' ID expr* ')'                          # FunctionCallExpr      
     | '(' 'if' expr ifBranch ifBranch? ')'      # IfExpr
     | '(' 'cond' condPair+ elseBranch? ')'      # CondExpr
@@ -17,6 +18,17 @@ expr: '(' 'define' definition ')'               # DefinitionExpr
     | '(' 'cons' expr expr ')'                  # ConsExpr
     | '(' 'null?' expr ')'                      # NullExpr
     | '(' 'let' '(' letBinding+ ')' expr+ ')'   # LetExpr
+    | '(' 'delay' expr ')'                      # DelayExpr
+    | '(' 'force' expr ')'                      # ForceExpr
+    | '(' 'stream-cons' expr expr ')'           # StreamConsExpr
+    | '(' 'stream-car' expr ')'                 # StreamCarExpr
+    | '(' 'stream-cdr' expr ')'                 # StreamCdrExpr
+    | '(' 'stream-take' expr expr ')'           # StreamTakeExpr
+    | '(' 'stream-map' expr expr ')'            # StreamMapExpr
+    | '(' 'stream-filter' expr expr ')'         # StreamFilterExpr
+    | '(' 'stream-from-input' ')'               # StreamFromInputExpr
+    | '(' 'stream-to-list' expr ')'             # StreamToListExpr
+    | '(' 'list-to-stream' expr ')'             # ListToStreamExpr
     | '(' 'display' expr ')'                    # DisplayExpr
     | '(' 'read' ')'                            # ReadExpr
     | '(' 'newline' ')'                         # NewlineExpr
@@ -0,0 +1,4 @@
+# src/interpreter/build/__init__.py
+"""
+Generated ANTLR lexer, parser and visitor for the Mini Scheme Interpreter.
+"""
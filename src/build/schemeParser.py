@@ -0,0 +1,2132 @@
+# Generated from scheme.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,49,300,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,1,0,5,0,26,8,0,10,
+        0,12,0,29,9,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,40,8,1,1,1,
+        1,1,1,1,1,1,5,1,46,8,1,10,1,12,1,49,9,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        3,1,57,8,1,1,1,1,1,1,1,1,1,1,1,4,1,64,8,1,11,1,12,1,65,1,1,3,1,69,
+        8,1,1,1,1,1,1,1,1,1,1,1,4,1,76,8,1,11,1,12,1,77,1,1,1,1,1,1,1,1,
+        1,1,4,1,85,8,1,11,1,12,1,86,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,4,1,99,8,1,11,1,12,1,100,1,1,1,1,1,1,1,1,1,1,4,1,108,8,1,11,
+        1,12,1,109,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,139,8,
+        1,11,1,12,1,140,1,1,1,1,4,1,145,8,1,11,1,12,1,146,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,3,1,220,8,1,1,2,1,2,1,2,1,2,1,2,5,2,227,8,2,10,2,12,
+        2,230,9,2,1,2,1,2,3,2,234,8,2,1,3,1,3,1,3,4,3,239,8,3,11,3,12,3,
+        240,1,3,1,3,1,3,3,3,246,8,3,1,4,1,4,1,4,4,4,251,8,4,11,4,12,4,252,
+        1,4,1,4,1,5,1,5,1,5,4,5,260,8,5,11,5,12,5,261,1,5,1,5,1,6,5,6,267,
+        8,6,10,6,12,6,270,9,6,1,7,1,7,1,7,1,7,1,7,1,8,1,8,3,8,279,8,8,1,
+        9,1,9,1,10,1,10,1,10,1,10,1,10,3,10,288,8,10,1,11,1,11,1,11,5,11,
+        293,8,11,10,11,12,11,296,9,11,1,11,1,11,1,11,0,0,12,0,2,4,6,8,10,
+        12,14,16,18,20,22,0,3,1,0,31,33,1,0,34,35,1,0,36,41,341,0,27,1,0,
+        0,0,2,219,1,0,0,0,4,233,1,0,0,0,6,245,1,0,0,0,8,247,1,0,0,0,10,256,
+        1,0,0,0,12,268,1,0,0,0,14,271,1,0,0,0,16,278,1,0,0,0,18,280,1,0,
+        0,0,20,287,1,0,0,0,22,289,1,0,0,0,24,26,3,2,1,0,25,24,1,0,0,0,26,
+        29,1,0,0,0,27,25,1,0,0,0,27,28,1,0,0,0,28,1,1,0,0,0,29,27,1,0,0,
+        0,30,31,5,1,0,0,31,32,5,2,0,0,32,33,3,4,2,0,33,34,5,3,0,0,34,220,
+        1,0,0,0,35,36,5,1,0,0,36,37,5,4,0,0,37,39,5,45,0,0,38,40,5,46,0,
+        0,39,38,1,0,0,0,39,40,1,0,0,0,40,41,1,0,0,0,41,220,5,3,0,0,42,43,
+        5,1,0,0,43,47,5,46,0,0,44,46,3,2,1,0,45,44,1,0,0,0,46,49,1,0,0,0,
+        47,45,1,0,0,0,47,48,1,0,0,0,48,50,1,0,0,0,49,47,1,0,0,0,50,220,5,
+        3,0,0,51,52,5,1,0,0,52,53,5,5,0,0,53,54,3,2,1,0,54,56,3,6,3,0,55,
+        57,3,6,3,0,56,55,1,0,0,0,56,57,1,0,0,0,57,58,1,0,0,0,58,59,5,3,0,
+        0,59,220,1,0,0,0,60,61,5,1,0,0,61,63,5,6,0,0,62,64,3,8,4,0,63,62,
+        1,0,0,0,64,65,1,0,0,0,65,63,1,0,0,0,65,66,1,0,0,0,66,68,1,0,0,0,
+        67,69,3,10,5,0,68,67,1,0,0,0,68,69,1,0,0,0,69,70,1,0,0,0,70,71,5,
+        3,0,0,71,220,1,0,0,0,72,73,5,1,0,0,73,75,5,7,0,0,74,76,3,2,1,0,75,
+        74,1,0,0,0,76,77,1,0,0,0,77,75,1,0,0,0,77,78,1,0,0,0,78,79,1,0,0,
+        0,79,80,5,3,0,0,80,220,1,0,0,0,81,82,5,1,0,0,82,84,5,8,0,0,83,85,
+        3,2,1,0,84,83,1,0,0,0,85,86,1,0,0,0,86,84,1,0,0,0,86,87,1,0,0,0,
+        87,88,1,0,0,0,88,89,5,3,0,0,89,220,1,0,0,0,90,91,5,1,0,0,91,92,5,
+        9,0,0,92,93,3,2,1,0,93,94,5,3,0,0,94,220,1,0,0,0,95,96,5,1,0,0,96,
+        98,3,16,8,0,97,99,3,2,1,0,98,97,1,0,0,0,99,100,1,0,0,0,100,98,1,
+        0,0,0,100,101,1,0,0,0,101,102,1,0,0,0,102,103,5,3,0,0,103,220,1,
+        0,0,0,104,105,5,1,0,0,105,107,3,18,9,0,106,108,3,2,1,0,107,106,1,
+        0,0,0,108,109,1,0,0,0,109,107,1,0,0,0,109,110,1,0,0,0,110,111,1,
+        0,0,0,111,112,5,3,0,0,112,220,1,0,0,0,113,114,5,1,0,0,114,115,5,
+        10,0,0,115,116,3,2,1,0,116,117,5,3,0,0,117,220,1,0,0,0,118,119,5,
+        1,0,0,119,120,5,11,0,0,120,121,3,2,1,0,121,122,5,3,0,0,122,220,1,
+        0,0,0,123,124,5,1,0,0,124,125,5,12,0,0,125,126,3,2,1,0,126,127,3,
+        2,1,0,127,128,5,3,0,0,128,220,1,0,0,0,129,130,5,1,0,0,130,131,5,
+        13,0,0,131,132,3,2,1,0,132,133,5,3,0,0,133,220,1,0,0,0,134,135,5,
+        1,0,0,135,136,5,14,0,0,136,138,5,1,0,0,137,139,3,14,7,0,138,137,
+        1,0,0,0,139,140,1,0,0,0,140,138,1,0,0,0,140,141,1,0,0,0,141,142,
+        1,0,0,0,142,144,5,3,0,0,143,145,3,2,1,0,144,143,1,0,0,0,145,146,
+        1,0,0,0,146,144,1,0,0,0,146,147,1,0,0,0,147,148,1,0,0,0,148,149,
+        5,3,0,0,149,220,1,0,0,0,150,151,5,1,0,0,151,152,5,15,0,0,152,153,
+        3,2,1,0,153,154,5,3,0,0,154,220,1,0,0,0,155,156,5,1,0,0,156,157,
+        5,16,0,0,157,158,3,2,1,0,158,159,5,3,0,0,159,220,1,0,0,0,160,161,
+        5,1,0,0,161,162,5,17,0,0,162,163,3,2,1,0,163,164,3,2,1,0,164,165,
+        5,3,0,0,165,220,1,0,0,0,166,167,5,1,0,0,167,168,5,18,0,0,168,169,
+        3,2,1,0,169,170,5,3,0,0,170,220,1,0,0,0,171,172,5,1,0,0,172,173,
+        5,19,0,0,173,174,3,2,1,0,174,175,5,3,0,0,175,220,1,0,0,0,176,177,
+        5,1,0,0,177,178,5,20,0,0,178,179,3,2,1,0,179,180,3,2,1,0,180,181,
+        5,3,0,0,181,220,1,0,0,0,182,183,5,1,0,0,183,184,5,21,0,0,184,185,
+        3,2,1,0,185,186,3,2,1,0,186,187,5,3,0,0,187,220,1,0,0,0,188,189,
+        5,1,0,0,189,190,5,22,0,0,190,191,3,2,1,0,191,192,3,2,1,0,192,193,
+        5,3,0,0,193,220,1,0,0,0,194,195,5,1,0,0,195,196,5,23,0,0,196,220,
+        5,3,0,0,197,198,5,1,0,0,198,199,5,24,0,0,199,200,3,2,1,0,200,201,
+        5,3,0,0,201,220,1,0,0,0,202,203,5,1,0,0,203,204,5,25,0,0,204,205,
+        3,2,1,0,205,206,5,3,0,0,206,220,1,0,0,0,207,208,5,1,0,0,208,209,
+        5,26,0,0,209,210,3,2,1,0,210,211,5,3,0,0,211,220,1,0,0,0,212,213,
+        5,1,0,0,213,214,5,27,0,0,214,220,5,3,0,0,215,216,5,1,0,0,216,217,
+        5,28,0,0,217,220,5,3,0,0,218,220,3,20,10,0,219,30,1,0,0,0,219,35,
+        1,0,0,0,219,42,1,0,0,0,219,51,1,0,0,0,219,60,1,0,0,0,219,72,1,0,
+        0,0,219,81,1,0,0,0,219,90,1,0,0,0,219,95,1,0,0,0,219,104,1,0,0,0,
+        219,113,1,0,0,0,219,118,1,0,0,0,219,123,1,0,0,0,219,129,1,0,0,0,
+        219,134,1,0,0,0,219,150,1,0,0,0,219,155,1,0,0,0,219,160,1,0,0,0,
+        219,166,1,0,0,0,219,171,1,0,0,0,219,176,1,0,0,0,219,182,1,0,0,0,
+        219,188,1,0,0,0,219,194,1,0,0,0,219,197,1,0,0,0,219,202,1,0,0,0,
+        219,207,1,0,0,0,219,212,1,0,0,0,219,215,1,0,0,0,219,218,1,0,0,0,
+        220,3,1,0,0,0,221,222,5,1,0,0,222,223,5,46,0,0,223,224,3,12,6,0,
+        224,228,5,3,0,0,225,227,3,2,1,0,226,225,1,0,0,0,227,230,1,0,0,0,
+        228,226,1,0,0,0,228,229,1,0,0,0,229,234,1,0,0,0,230,228,1,0,0,0,
+        231,232,5,46,0,0,232,234,3,2,1,0,233,221,1,0,0,0,233,231,1,0,0,0,
+        234,5,1,0,0,0,235,236,5,1,0,0,236,238,5,29,0,0,237,239,3,2,1,0,238,
+        237,1,0,0,0,239,240,1,0,0,0,240,238,1,0,0,0,240,241,1,0,0,0,241,
+        242,1,0,0,0,242,243,5,3,0,0,243,246,1,0,0,0,244,246,3,2,1,0,245,
+        235,1,0,0,0,245,244,1,0,0,0,246,7,1,0,0,0,247,248,5,1,0,0,248,250,
+        3,2,1,0,249,251,3,2,1,0,250,249,1,0,0,0,251,252,1,0,0,0,252,250,
+        1,0,0,0,252,253,1,0,0,0,253,254,1,0,0,0,254,255,5,3,0,0,255,9,1,
+        0,0,0,256,257,5,1,0,0,257,259,5,30,0,0,258,260,3,2,1,0,259,258,1,
+        0,0,0,260,261,1,0,0,0,261,259,1,0,0,0,261,262,1,0,0,0,262,263,1,
+        0,0,0,263,264,5,3,0,0,264,11,1,0,0,0,265,267,5,46,0,0,266,265,1,
+        0,0,0,267,270,1,0,0,0,268,266,1,0,0,0,268,269,1,0,0,0,269,13,1,0,
+        0,0,270,268,1,0,0,0,271,272,5,1,0,0,272,273,5,46,0,0,273,274,3,2,
+        1,0,274,275,5,3,0,0,275,15,1,0,0,0,276,279,7,0,0,0,277,279,7,1,0,
+        0,278,276,1,0,0,0,278,277,1,0,0,0,279,17,1,0,0,0,280,281,7,2,0,0,
+        281,19,1,0,0,0,282,288,3,22,11,0,283,288,5,43,0,0,284,288,5,44,0,
+        0,285,288,5,45,0,0,286,288,5,46,0,0,287,282,1,0,0,0,287,283,1,0,
+        0,0,287,284,1,0,0,0,287,285,1,0,0,0,287,286,1,0,0,0,288,21,1,0,0,
+        0,289,290,5,42,0,0,290,294,5,1,0,0,291,293,3,20,10,0,292,291,1,0,
+        0,0,293,296,1,0,0,0,294,292,1,0,0,0,294,295,1,0,0,0,295,297,1,0,
+        0,0,296,294,1,0,0,0,297,298,5,3,0,0,298,23,1,0,0,0,23,27,39,47,56,
+        65,68,77,86,100,109,140,146,219,228,233,240,245,252,261,268,278,
+        287,294
+    ]
+
+class schemeParser ( Parser ):
+
+    grammarFileName = "scheme.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'('", "'define'", "')'", "'import'", 
+                     "'if'", "'cond'", "'and'", "'or'", "'not'", "'car'", 
+                     "'cdr'", "'cons'", "'null?'", "'let'", "'delay'", "'force'", 
+                     "'stream-cons'", "'stream-car'", "'stream-cdr'", "'stream-take'", 
+                     "'stream-map'", "'stream-filter'", "'stream-from-input'", 
+                     "'stream-to-list'", "'list-to-stream'", "'display'", 
+                     "'read'", "'newline'", "'begin'", "'else'", "'*'", 
+                     "'/'", "'mod'", "'+'", "'-'", "'='", "'<>'", "'<'", 
+                     "'>'", "'<='", "'>='", "'''" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "NUMBER", "BOOLEAN", 
+                      "STRING", "ID", "COMMENT", "WS", "LEXICAL_ERROR" ]
+
+    RULE_root = 0
+    RULE_expr = 1
+    RULE_definition = 2
+    RULE_ifBranch = 3
+    RULE_condPair = 4
+    RULE_elseBranch = 5
+    RULE_parameters = 6
+    RULE_letBinding = 7
+    RULE_arOperator = 8
+    RULE_relOperator = 9
+    RULE_literal = 10
+    RULE_quotedList = 11
+
+    ruleNames =  [ "root", "expr", "definition", "ifBranch", "condPair", 
+                   "elseBranch", "parameters", "letBinding", "arOperator", 
+                   "relOperator", "literal", "quotedList" ]
+
+    EOF = Token.EOF
+    T__0=1
+    T__1=2
+    T__2=3
+    T__3=4
+    T__4=5
+    T__5=6
+    T__6=7
+    T__7=8
+    T__8=9
+    T__9=10
+    T__10=11
+    T__11=12
+    T__12=13
+    T__13=14
+    T__14=15
+    T__15=16
+    T__16=17
+    T__17=18
+    T__18=19
+    T__19=20
+    T__20=21
+    T__21=22
+    T__22=23
+    T__23=24
+    T__24=25
+    T__25=26
+    T__26=27
+    T__27=28
+    T__28=29
+    T__29=30
+    T__30=31
+    T__31=32
+    T__32=33
+    T__33=34
+    T__34=35
+    T__35=36
+    T__36=37
+    T__37=38
+    T__38=39
+    T__39=40
+    T__40=41
+    T__41=42
+    NUMBER=43
+    BOOLEAN=44
+    STRING=45
+    ID=46
+    COMMENT=47
+    WS=48
+    LEXICAL_ERROR=49
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class RootContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_root
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRoot" ):
+                return visitor.visitRoot(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def root(self):
+
+        localctx = schemeParser.RootContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_root)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 27
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0):
+                self.state = 24
+                self.expr()
+                self.state = 29
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class AndExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAndExpr" ):
+                return visitor.visitAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IfExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+        def ifBranch(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.IfBranchContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.IfBranchContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfExpr" ):
+                return visitor.visitIfExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NewlineExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNewlineExpr" ):
+                return visitor.visitNewlineExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamConsExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamConsExpr" ):
+                return visitor.visitStreamConsExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ConsExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConsExpr" ):
+                return visitor.visitConsExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DelayExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDelayExpr" ):
+                return visitor.visitDelayExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class CondExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condPair(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.CondPairContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.CondPairContext,i)
+
+        def elseBranch(self):
+            return self.getTypedRuleContext(schemeParser.ElseBranchContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCondExpr" ):
+                return visitor.visitCondExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NullExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNullExpr" ):
+                return visitor.visitNullExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ArithmeticOperationExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def arOperator(self):
+            return self.getTypedRuleContext(schemeParser.ArOperatorContext,0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArithmeticOperationExpr" ):
+                return visitor.visitArithmeticOperationExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RelationalOperationExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def relOperator(self):
+            return self.getTypedRuleContext(schemeParser.RelOperatorContext,0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalOperationExpr" ):
+                return visitor.visitRelationalOperationExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ReadExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReadExpr" ):
+                return visitor.visitReadExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamFilterExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamFilterExpr" ):
+                return visitor.visitStreamFilterExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LiteralExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def literal(self):
+            return self.getTypedRuleContext(schemeParser.LiteralContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiteralExpr" ):
+                return visitor.visitLiteralExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NotExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNotExpr" ):
+                return visitor.visitNotExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamMapExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamMapExpr" ):
+                return visitor.visitStreamMapExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ListToStreamExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitListToStreamExpr" ):
+                return visitor.visitListToStreamExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ForceExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForceExpr" ):
+                return visitor.visitForceExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamCarExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamCarExpr" ):
+                return visitor.visitStreamCarExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamCdrExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamCdrExpr" ):
+                return visitor.visitStreamCdrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ImportExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def STRING(self):
+            return self.getToken(schemeParser.STRING, 0)
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitImportExpr" ):
+                return visitor.visitImportExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamToListExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamToListExpr" ):
+                return visitor.visitStreamToListExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class CarExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCarExpr" ):
+                return visitor.visitCarExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LetExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def letBinding(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.LetBindingContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.LetBindingContext,i)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLetExpr" ):
+                return visitor.visitLetExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamTakeExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamTakeExpr" ):
+                return visitor.visitStreamTakeExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DisplayExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDisplayExpr" ):
+                return visitor.visitDisplayExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DefinitionExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def definition(self):
+            return self.getTypedRuleContext(schemeParser.DefinitionContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefinitionExpr" ):
+                return visitor.visitDefinitionExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class CdrExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCdrExpr" ):
+                return visitor.visitCdrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class OrExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrExpr" ):
+                return visitor.visitOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class FunctionCallExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionCallExpr" ):
+                return visitor.visitFunctionCallExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StreamFromInputExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStreamFromInputExpr" ):
+                return visitor.visitStreamFromInputExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self):
+
+        localctx = schemeParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_expr)
+        self._la = 0 # Token type
+        try:
+            self.state = 219
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
+            if la_ == 1:
+                localctx = schemeParser.DefinitionExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 30
+                self.match(schemeParser.T__0)
+                self.state = 31
+                self.match(schemeParser.T__1)
+                self.state = 32
+                self.definition()
+                self.state = 33
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 2:
+                localctx = schemeParser.ImportExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 35
+                self.match(schemeParser.T__0)
+                self.state = 36
+                self.match(schemeParser.T__3)
+                self.state = 37
+                self.match(schemeParser.STRING)
+                self.state = 39
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==46:
+                    self.state = 38
+                    self.match(schemeParser.ID)
+
+
+                self.state = 41
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 3:
+                localctx = schemeParser.FunctionCallExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 42
+                self.match(schemeParser.T__0)
+                self.state = 43
+                self.match(schemeParser.ID)
+                self.state = 47
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0):
+                    self.state = 44
+                    self.expr()
+                    self.state = 49
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 50
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 4:
+                localctx = schemeParser.IfExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 51
+                self.match(schemeParser.T__0)
+                self.state = 52
+                self.match(schemeParser.T__4)
+                self.state = 53
+                self.expr()
+                self.state = 54
+                self.ifBranch()
+                self.state = 56
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0):
+                    self.state = 55
+                    self.ifBranch()
+
+
+                self.state = 58
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 5:
+                localctx = schemeParser.CondExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 60
+                self.match(schemeParser.T__0)
+                self.state = 61
+                self.match(schemeParser.T__5)
+                self.state = 63 
+                self._errHandler.sync(self)
+                _alt = 1
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt == 1:
+                        self.state = 62
+                        self.condPair()
+
+                    else:
+                        raise NoViableAltException(self)
+                    self.state = 65 
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,4,self._ctx)
+
+                self.state = 68
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==1:
+                    self.state = 67
+                    self.elseBranch()
+
+
+                self.state = 70
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 6:
+                localctx = schemeParser.AndExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 72
+                self.match(schemeParser.T__0)
+                self.state = 73
+                self.match(schemeParser.T__6)
+                self.state = 75 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 74
+                    self.expr()
+                    self.state = 77 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 79
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 7:
+                localctx = schemeParser.OrExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
+                self.state = 81
+                self.match(schemeParser.T__0)
+                self.state = 82
+                self.match(schemeParser.T__7)
+                self.state = 84 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 83
+                    self.expr()
+                    self.state = 86 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 88
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 8:
+                localctx = schemeParser.NotExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 8)
+                self.state = 90
+                self.match(schemeParser.T__0)
+                self.state = 91
+                self.match(schemeParser.T__8)
+                self.state = 92
+                self.expr()
+                self.state = 93
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 9:
+                localctx = schemeParser.ArithmeticOperationExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 9)
+                self.state = 95
+                self.match(schemeParser.T__0)
+                self.state = 96
+                self.arOperator()
+                self.state = 98 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 97
+                    self.expr()
+                    self.state = 100 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 102
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 10:
+                localctx = schemeParser.RelationalOperationExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 10)
+                self.state = 104
+                self.match(schemeParser.T__0)
+                self.state = 105
+                self.relOperator()
+                self.state = 107 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 106
+                    self.expr()
+                    self.state = 109 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 111
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 11:
+                localctx = schemeParser.CarExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 11)
+                self.state = 113
+                self.match(schemeParser.T__0)
+                self.state = 114
+                self.match(schemeParser.T__9)
+                self.state = 115
+                self.expr()
+                self.state = 116
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 12:
+                localctx = schemeParser.CdrExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 12)
+                self.state = 118
+                self.match(schemeParser.T__0)
+                self.state = 119
+                self.match(schemeParser.T__10)
+                self.state = 120
+                self.expr()
+                self.state = 121
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 13:
+                localctx = schemeParser.ConsExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 13)
+                self.state = 123
+                self.match(schemeParser.T__0)
+                self.state = 124
+                self.match(schemeParser.T__11)
+                self.state = 125
+                self.expr()
+                self.state = 126
+                self.expr()
+                self.state = 127
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 14:
+                localctx = schemeParser.NullExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 14)
+                self.state = 129
+                self.match(schemeParser.T__0)
+                self.state = 130
+                self.match(schemeParser.T__12)
+                self.state = 131
+                self.expr()
+                self.state = 132
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 15:
+                localctx = schemeParser.LetExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 15)
+                self.state = 134
+                self.match(schemeParser.T__0)
+                self.state = 135
+                self.match(schemeParser.T__13)
+                self.state = 136
+                self.match(schemeParser.T__0)
+                self.state = 138 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 137
+                    self.letBinding()
+                    self.state = 140 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==1):
+                        break
+
+                self.state = 142
+                self.match(schemeParser.T__2)
+                self.state = 144 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 143
+                    self.expr()
+                    self.state = 146 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 148
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 16:
+                localctx = schemeParser.DelayExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 16)
+                self.state = 150
+                self.match(schemeParser.T__0)
+                self.state = 151
+                self.match(schemeParser.T__14)
+                self.state = 152
+                self.expr()
+                self.state = 153
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 17:
+                localctx = schemeParser.ForceExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 17)
+                self.state = 155
+                self.match(schemeParser.T__0)
+                self.state = 156
+                self.match(schemeParser.T__15)
+                self.state = 157
+                self.expr()
+                self.state = 158
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 18:
+                localctx = schemeParser.StreamConsExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 18)
+                self.state = 160
+                self.match(schemeParser.T__0)
+                self.state = 161
+                self.match(schemeParser.T__16)
+                self.state = 162
+                self.expr()
+                self.state = 163
+                self.expr()
+                self.state = 164
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 19:
+                localctx = schemeParser.StreamCarExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 19)
+                self.state = 166
+                self.match(schemeParser.T__0)
+                self.state = 167
+                self.match(schemeParser.T__17)
+                self.state = 168
+                self.expr()
+                self.state = 169
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 20:
+                localctx = schemeParser.StreamCdrExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 20)
+                self.state = 171
+                self.match(schemeParser.T__0)
+                self.state = 172
+                self.match(schemeParser.T__18)
+                self.state = 173
+                self.expr()
+                self.state = 174
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 21:
+                localctx = schemeParser.StreamTakeExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 21)
+                self.state = 176
+                self.match(schemeParser.T__0)
+                self.state = 177
+                self.match(schemeParser.T__19)
+                self.state = 178
+                self.expr()
+                self.state = 179
+                self.expr()
+                self.state = 180
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 22:
+                localctx = schemeParser.StreamMapExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 22)
+                self.state = 182
+                self.match(schemeParser.T__0)
+                self.state = 183
+                self.match(schemeParser.T__20)
+                self.state = 184
+                self.expr()
+                self.state = 185
+                self.expr()
+                self.state = 186
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 23:
+                localctx = schemeParser.StreamFilterExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 23)
+                self.state = 188
+                self.match(schemeParser.T__0)
+                self.state = 189
+                self.match(schemeParser.T__21)
+                self.state = 190
+                self.expr()
+                self.state = 191
+                self.expr()
+                self.state = 192
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 24:
+                localctx = schemeParser.StreamFromInputExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 24)
+                self.state = 194
+                self.match(schemeParser.T__0)
+                self.state = 195
+                self.match(schemeParser.T__22)
+                self.state = 196
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 25:
+                localctx = schemeParser.StreamToListExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 25)
+                self.state = 197
+                self.match(schemeParser.T__0)
+                self.state = 198
+                self.match(schemeParser.T__23)
+                self.state = 199
+                self.expr()
+                self.state = 200
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 26:
+                localctx = schemeParser.ListToStreamExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 26)
+                self.state = 202
+                self.match(schemeParser.T__0)
+                self.state = 203
+                self.match(schemeParser.T__24)
+                self.state = 204
+                self.expr()
+                self.state = 205
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 27:
+                localctx = schemeParser.DisplayExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 27)
+                self.state = 207
+                self.match(schemeParser.T__0)
+                self.state = 208
+                self.match(schemeParser.T__25)
+                self.state = 209
+                self.expr()
+                self.state = 210
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 28:
+                localctx = schemeParser.ReadExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 28)
+                self.state = 212
+                self.match(schemeParser.T__0)
+                self.state = 213
+                self.match(schemeParser.T__26)
+                self.state = 214
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 29:
+                localctx = schemeParser.NewlineExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 29)
+                self.state = 215
+                self.match(schemeParser.T__0)
+                self.state = 216
+                self.match(schemeParser.T__27)
+                self.state = 217
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 30:
+                localctx = schemeParser.LiteralExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 30)
+                self.state = 218
+                self.literal()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefinitionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_definition
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class FunctionDefinitionExprContext(DefinitionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.DefinitionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+        def parameters(self):
+            return self.getTypedRuleContext(schemeParser.ParametersContext,0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionDefinitionExpr" ):
+                return visitor.visitFunctionDefinitionExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ConstantDefinitionExprContext(DefinitionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.DefinitionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstantDefinitionExpr" ):
+                return visitor.visitConstantDefinitionExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def definition(self):
+
+        localctx = schemeParser.DefinitionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_definition)
+        self._la = 0 # Token type
+        try:
+            self.state = 233
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [1]:
+                localctx = schemeParser.FunctionDefinitionExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 221
+                self.match(schemeParser.T__0)
+                self.state = 222
+                self.match(schemeParser.ID)
+                self.state = 223
+                self.parameters()
+                self.state = 224
+                self.match(schemeParser.T__2)
+                self.state = 228
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0):
+                    self.state = 225
+                    self.expr()
+                    self.state = 230
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            elif token in [46]:
+                localctx = schemeParser.ConstantDefinitionExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 231
+                self.match(schemeParser.ID)
+                self.state = 232
+                self.expr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfBranchContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_ifBranch
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class IfBeginExprContext(IfBranchContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.IfBranchContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfBeginExpr" ):
+                return visitor.visitIfBeginExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IfSingleExprContext(IfBranchContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.IfBranchContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfSingleExpr" ):
+                return visitor.visitIfSingleExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def ifBranch(self):
+
+        localctx = schemeParser.IfBranchContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_ifBranch)
+        self._la = 0 # Token type
+        try:
+            self.state = 245
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+            if la_ == 1:
+                localctx = schemeParser.IfBeginExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 235
+                self.match(schemeParser.T__0)
+                self.state = 236
+                self.match(schemeParser.T__28)
+                self.state = 238 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 237
+                    self.expr()
+                    self.state = 240 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                        break
+
+                self.state = 242
+                self.match(schemeParser.T__2)
+                pass
+
+            elif la_ == 2:
+                localctx = schemeParser.IfSingleExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 244
+                self.expr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CondPairContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_condPair
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCondPair" ):
+                return visitor.visitCondPair(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def condPair(self):
+
+        localctx = schemeParser.CondPairContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_condPair)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 247
+            self.match(schemeParser.T__0)
+            self.state = 248
+            self.expr()
+            self.state = 250 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 249
+                self.expr()
+                self.state = 252 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                    break
+
+            self.state = 254
+            self.match(schemeParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ElseBranchContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_elseBranch
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElseBranch" ):
+                return visitor.visitElseBranch(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elseBranch(self):
+
+        localctx = schemeParser.ElseBranchContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_elseBranch)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 256
+            self.match(schemeParser.T__0)
+            self.state = 257
+            self.match(schemeParser.T__29)
+            self.state = 259 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 258
+                self.expr()
+                self.state = 261 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844226) != 0)):
+                    break
+
+            self.state = 263
+            self.match(schemeParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParametersContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(schemeParser.ID)
+            else:
+                return self.getToken(schemeParser.ID, i)
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_parameters
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParameters" ):
+                return visitor.visitParameters(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parameters(self):
+
+        localctx = schemeParser.ParametersContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_parameters)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 268
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==46:
+                self.state = 265
+                self.match(schemeParser.ID)
+                self.state = 270
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LetBindingContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(schemeParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_letBinding
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLetBinding" ):
+                return visitor.visitLetBinding(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def letBinding(self):
+
+        localctx = schemeParser.LetBindingContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_letBinding)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 271
+            self.match(schemeParser.T__0)
+            self.state = 272
+            self.match(schemeParser.ID)
+            self.state = 273
+            self.expr()
+            self.state = 274
+            self.match(schemeParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArOperatorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_arOperator
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArOperator" ):
+                return visitor.visitArOperator(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arOperator(self):
+
+        localctx = schemeParser.ArOperatorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_arOperator)
+        self._la = 0 # Token type
+        try:
+            self.state = 278
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [31, 32, 33]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 276
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 15032385536) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+            elif token in [34, 35]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 277
+                _la = self._input.LA(1)
+                if not(_la==34 or _la==35):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelOperatorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_relOperator
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelOperator" ):
+                return visitor.visitRelOperator(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relOperator(self):
+
+        localctx = schemeParser.RelOperatorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_relOperator)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 280
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4329327034368) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LiteralContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_literal
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class StringExprContext(LiteralContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.LiteralContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def STRING(self):
+            return self.getToken(schemeParser.STRING, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStringExpr" ):
+                return visitor.visitStringExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NumberExprContext(LiteralContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.LiteralContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def NUMBER(self):
+            return self.getToken(schemeParser.NUMBER, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNumberExpr" ):
+                return visitor.visitNumberExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IdentifierExprContext(LiteralContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.LiteralContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(schemeParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifierExpr" ):
+                return visitor.visitIdentifierExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BooleanExprContext(LiteralContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.LiteralContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def BOOLEAN(self):
+            return self.getToken(schemeParser.BOOLEAN, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBooleanExpr" ):
+                return visitor.visitBooleanExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class QuotedListExprContext(LiteralContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a schemeParser.LiteralContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def quotedList(self):
+            return self.getTypedRuleContext(schemeParser.QuotedListContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitQuotedListExpr" ):
+                return visitor.visitQuotedListExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def literal(self):
+
+        localctx = schemeParser.LiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_literal)
+        try:
+            self.state = 287
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [42]:
+                localctx = schemeParser.QuotedListExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 282
+                self.quotedList()
+                pass
+            elif token in [43]:
+                localctx = schemeParser.NumberExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 283
+                self.match(schemeParser.NUMBER)
+                pass
+            elif token in [44]:
+                localctx = schemeParser.BooleanExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 284
+                self.match(schemeParser.BOOLEAN)
+                pass
+            elif token in [45]:
+                localctx = schemeParser.StringExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 285
+                self.match(schemeParser.STRING)
+                pass
+            elif token in [46]:
+                localctx = schemeParser.IdentifierExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 286
+                self.match(schemeParser.ID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class QuotedListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def literal(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(schemeParser.LiteralContext)
+            else:
+                return self.getTypedRuleContext(schemeParser.LiteralContext,i)
+
+
+        def getRuleIndex(self):
+            return schemeParser.RULE_quotedList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitQuotedList" ):
+                return visitor.visitQuotedList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def quotedList(self):
+
+        localctx = schemeParser.QuotedListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_quotedList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 289
+            self.match(schemeParser.T__41)
+            self.state = 290
+            self.match(schemeParser.T__0)
+            self.state = 294
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 136339441844224) != 0):
+                self.state = 291
+                self.literal()
+                self.state = 296
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 297
+            self.match(schemeParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
@@ -0,0 +1,248 @@
+# Generated from scheme.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .schemeParser import schemeParser
+else:
+    from schemeParser import schemeParser
+
+# This class defines a complete generic visitor for a parse tree produced by schemeParser.
+
+class schemeVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by schemeParser#root.
+    def visitRoot(self, ctx:schemeParser.RootContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#DefinitionExpr.
+    def visitDefinitionExpr(self, ctx:schemeParser.DefinitionExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ImportExpr.
+    def visitImportExpr(self, ctx:schemeParser.ImportExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#FunctionCallExpr.
+    def visitFunctionCallExpr(self, ctx:schemeParser.FunctionCallExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#IfExpr.
+    def visitIfExpr(self, ctx:schemeParser.IfExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#CondExpr.
+    def visitCondExpr(self, ctx:schemeParser.CondExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#AndExpr.
+    def visitAndExpr(self, ctx:schemeParser.AndExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#OrExpr.
+    def visitOrExpr(self, ctx:schemeParser.OrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#NotExpr.
+    def visitNotExpr(self, ctx:schemeParser.NotExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ArithmeticOperationExpr.
+    def visitArithmeticOperationExpr(self, ctx:schemeParser.ArithmeticOperationExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#RelationalOperationExpr.
+    def visitRelationalOperationExpr(self, ctx:schemeParser.RelationalOperationExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#CarExpr.
+    def visitCarExpr(self, ctx:schemeParser.CarExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#CdrExpr.
+    def visitCdrExpr(self, ctx:schemeParser.CdrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ConsExpr.
+    def visitConsExpr(self, ctx:schemeParser.ConsExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#NullExpr.
+    def visitNullExpr(self, ctx:schemeParser.NullExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#LetExpr.
+    def visitLetExpr(self, ctx:schemeParser.LetExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#DelayExpr.
+    def visitDelayExpr(self, ctx:schemeParser.DelayExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ForceExpr.
+    def visitForceExpr(self, ctx:schemeParser.ForceExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamConsExpr.
+    def visitStreamConsExpr(self, ctx:schemeParser.StreamConsExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamCarExpr.
+    def visitStreamCarExpr(self, ctx:schemeParser.StreamCarExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamCdrExpr.
+    def visitStreamCdrExpr(self, ctx:schemeParser.StreamCdrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamTakeExpr.
+    def visitStreamTakeExpr(self, ctx:schemeParser.StreamTakeExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamMapExpr.
+    def visitStreamMapExpr(self, ctx:schemeParser.StreamMapExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamFilterExpr.
+    def visitStreamFilterExpr(self, ctx:schemeParser.StreamFilterExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamFromInputExpr.
+    def visitStreamFromInputExpr(self, ctx:schemeParser.StreamFromInputExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StreamToListExpr.
+    def visitStreamToListExpr(self, ctx:schemeParser.StreamToListExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ListToStreamExpr.
+    def visitListToStreamExpr(self, ctx:schemeParser.ListToStreamExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#DisplayExpr.
+    def visitDisplayExpr(self, ctx:schemeParser.DisplayExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ReadExpr.
+    def visitReadExpr(self, ctx:schemeParser.ReadExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#NewlineExpr.
+    def visitNewlineExpr(self, ctx:schemeParser.NewlineExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#LiteralExpr.
+    def visitLiteralExpr(self, ctx:schemeParser.LiteralExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#FunctionDefinitionExpr.
+    def visitFunctionDefinitionExpr(self, ctx:schemeParser.FunctionDefinitionExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#ConstantDefinitionExpr.
+    def visitConstantDefinitionExpr(self, ctx:schemeParser.ConstantDefinitionExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#IfBeginExpr.
+    def visitIfBeginExpr(self, ctx:schemeParser.IfBeginExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#IfSingleExpr.
+    def visitIfSingleExpr(self, ctx:schemeParser.IfSingleExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#condPair.
+    def visitCondPair(self, ctx:schemeParser.CondPairContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#elseBranch.
+    def visitElseBranch(self, ctx:schemeParser.ElseBranchContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#parameters.
+    def visitParameters(self, ctx:schemeParser.ParametersContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#letBinding.
+    def visitLetBinding(self, ctx:schemeParser.LetBindingContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#arOperator.
+    def visitArOperator(self, ctx:schemeParser.ArOperatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#relOperator.
+    def visitRelOperator(self, ctx:schemeParser.RelOperatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#QuotedListExpr.
+    def visitQuotedListExpr(self, ctx:schemeParser.QuotedListExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#NumberExpr.
+    def visitNumberExpr(self, ctx:schemeParser.NumberExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#BooleanExpr.
+    def visitBooleanExpr(self, ctx:schemeParser.BooleanExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#StringExpr.
+    def visitStringExpr(self, ctx:schemeParser.StringExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#IdentifierExpr.
+    def visitIdentifierExpr(self, ctx:schemeParser.IdentifierExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by schemeParser#quotedList.
+    def visitQuotedList(self, ctx:schemeParser.QuotedListContext):
+        return self.visitChildren(ctx)
+
+
+
+del schemeParser
\ No newline at end of file
@@ -1,6 +1,14 @@
 # src/interpreter/__init__.py
 from .visitor import SchemeVisitor
-from .utilities import parse_expression, format_for_scheme, run_program
+from .utilities import parse_expression, format_for_scheme, compile_program, run_program
 from .builtins import define_builtins
+from .modules import Module, ModuleLoader
+from .profiler import Profiler, ProfilingVisitor
+from .embedding import AsyncInterpreter, AsyncVisitor, ProgramCancelled
+from .streams import Promise, StreamPair
 
-__all__ = ["SchemeVisitor", "parse_expression", "format_for_scheme", "run_program", "define_builtins"]
+__all__ = [
+    "SchemeVisitor", "parse_expression", "format_for_scheme", "compile_program", "run_program",
+    "define_builtins", "Module", "ModuleLoader", "Profiler", "ProfilingVisitor",
+    "AsyncInterpreter", "AsyncVisitor", "ProgramCancelled", "Promise", "StreamPair"
+]
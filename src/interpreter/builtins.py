@@ -1,3 +1,7 @@
+from functools import lru_cache
+from interpreter.utilities import parse_expression
+
+
 def define_builtins():
     """
     Define and return built-in functions for the Mini Scheme interpreter.
@@ -33,4 +37,19 @@ def define_builtins():
     return {
         'map': (params, map_body_string),
         'filter': (params, filter_body_string),
-    }
\ No newline at end of file
+    }
+
+
+@lru_cache(maxsize=None)
+def compile_builtins():
+    """
+    Parse the built-in functions once per process.
+
+    Returns:
+        dict: A dictionary mapping built-in function names to their parameter lists
+        and bodies as lists of parsed expressions, ready to be stored in a symbol table.
+    """
+    return {
+        name: (params, [parse_expression(body_string, f"<builtin {name}>").expr()])
+        for name, (params, body_string) in define_builtins().items()
+    }
@@ -0,0 +1,290 @@
+import asyncio
+import sys
+import threading
+from interpreter.visitor import SchemeVisitor
+from interpreter.modules import ModuleLoader
+from interpreter.utilities import parse_expression, run_tree
+from build.schemeParser import schemeParser
+
+# Program running in the current thread, if any
+_current = threading.local()
+
+# Stack size of the program threads, large enough for any recursion allowed by the interpreter's recursion
+# limit, as secondary threads may get a much smaller stack than the main thread (e.g. 512 KiB on macOS)
+PROGRAM_STACK_SIZE = 256 * 1024 * 1024
+
+
+class ProgramCancelled(Exception):
+    """Raised inside a program's evaluation when the program is cancelled."""
+
+
+class ProgramThread:
+    """
+    Thread evaluating a single Scheme program as a coroutine of the event loop.
+
+    The thread only runs between a call to `start` or `resume` and its next request: every
+    `steps_per_yield` evaluated expressions, and whenever the program reads input, it suspends
+    itself and waits until the event loop resumes it. The event loop keeps running meanwhile.
+    """
+
+    def __init__(self, loop, steps_per_yield, evaluate):
+        """
+        Initialize the program thread.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop driving the program.
+            steps_per_yield (int): Number of expressions evaluated between two suspensions.
+            evaluate (callable): Function evaluating the program in the thread and returning its result.
+        """
+        self.loop = loop
+        self.steps_per_yield = steps_per_yield
+        self.evaluate = evaluate
+        self.steps = 0
+        self.output = []  # Text written by the program since the last suspension
+        self.cancelled = False
+        self.resumed = threading.Event()
+        self.request = None  # Future resolved with the next request of the program
+        self.value = None  # Value sent to the program when it is resumed
+        self.error = None  # Exception raised in the program when it is resumed
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """
+        Start evaluating the program.
+
+        Returns:
+            asyncio.Future: Future resolved with the first request of the program.
+        """
+        self.request = self.loop.create_future()
+        previous_stack_size = threading.stack_size(PROGRAM_STACK_SIZE)
+        try:
+            self.thread.start()
+        finally:
+            threading.stack_size(previous_stack_size)
+        return self.request
+
+    def resume(self, value=None, error=None):
+        """
+        Resume the suspended program.
+
+        Args:
+            value (any): The value returned to the program by the suspension.
+            error (Exception): If given, the exception raised in the program by the suspension.
+
+        Returns:
+            asyncio.Future: Future resolved with the next request of the program.
+        """
+        self.request = self.loop.create_future()
+        self.value = value
+        self.error = error
+        self.resumed.set()
+        return self.request
+
+    def cancel(self):
+        """
+        Cancel the program, which raises `ProgramCancelled` at its next step or suspension.
+        """
+        self.cancelled = True
+        self.resumed.set()
+
+    def run(self):
+        """
+        Evaluate the program and send its result or error as the last request.
+        """
+        _current.program = self
+        try:
+            request = ("done", self.evaluate())
+        except SystemExit as e:
+            request = ("error", ValueError(f"Program exited with status {e.code}."))
+        except BaseException as e:
+            request = ("error", e)
+        self.send(request)
+
+    def send(self, request):
+        """
+        Resolve the pending request future from the program thread.
+
+        Args:
+            request (tuple): The kind of request and its payload.
+        """
+        def resolve(future=self.request):
+            if not future.done():
+                future.set_result(request)
+
+        self.loop.call_soon_threadsafe(resolve)
+
+    def suspend(self, kind):
+        """
+        Hand control back to the event loop until the program is resumed.
+
+        Args:
+            kind (str): The reason of the suspension ('yield' or 'read').
+
+        Returns:
+            any: The value the program was resumed with.
+        """
+        if self.cancelled:
+            raise ProgramCancelled()
+
+        self.send((kind, None))
+        self.resumed.wait()
+        self.resumed.clear()
+
+        if self.cancelled:
+            raise ProgramCancelled()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def step(self):
+        """
+        Count an evaluated expression, suspending the program every `steps_per_yield` expressions.
+        """
+        if self.cancelled:
+            raise ProgramCancelled()
+
+        self.steps += 1
+        if self.steps % self.steps_per_yield == 0:
+            self.suspend("yield")
+
+
+class AsyncVisitor(SchemeVisitor):
+    """Visitor whose input, output and scheduling are handled by the program running in its thread."""
+
+    def visit(self, tree):
+        """
+        Visit a node, counting it as a step of the running program if it is an expression.
+
+        Returns:
+            object: The result of visiting the node.
+        """
+        if isinstance(tree, schemeParser.ExprContext):
+            _current.program.step()
+        # Accepted directly rather than through super().visit, so that programs use as many stack frames as in the CLI
+        return tree.accept(self)
+
+    def write(self, *values, end="\n"):
+        """
+        Write values to the output of the running program.
+
+        Args:
+            values (any): The values to write, separated by spaces.
+            end (str): The string written after the values.
+        """
+        _current.program.output.append(" ".join(map(str, values)) + end)
+
+    def read_line(self):
+        """
+        Read a line from the input source of the running program.
+
+        Returns:
+            str: The line read.
+        """
+        return _current.program.suspend("read")
+
+
+class AsyncInterpreter:
+    """
+    Interpreter running Scheme programs concurrently in an asyncio event loop.
+
+    Each program yields control to the event loop every `steps_per_yield` evaluated expressions,
+    reads its input from an async input source and writes its output to an async sink. Programs
+    are cancelled by cancelling the task awaiting `run`.
+
+    Each program is evaluated in its own thread, but only one program runs at a time: the others
+    wait for their turn in FIFO order. Programs do not share any state, as each of them loads its
+    own instances of the modules it imports.
+
+    Example:
+        interpreter = AsyncInterpreter(steps_per_yield=500)
+        results = await asyncio.gather(interpreter.run(source_a), interpreter.run(source_b))
+    """
+
+    def __init__(self, steps_per_yield=1000):
+        """
+        Initialize the interpreter.
+
+        Args:
+            steps_per_yield (int): Number of expressions a program evaluates before yielding control.
+        """
+        self.steps_per_yield = steps_per_yield
+        self.running = asyncio.Lock()  # Held by the program currently running
+
+    async def run(self, source_code, input_source=None, output_sink=None, module_path=None):
+        """
+        Run a Scheme program, evaluating its definitions and then its main function.
+
+        Args:
+            source_code (str): The source code of the Scheme program.
+            input_source (callable): Coroutine function returning the next input line for 'read',
+                or raising EOFError at the end of the input. Reading raises EOFError if not given.
+            output_sink (callable): Coroutine function receiving the text written by the program.
+                The text is written to the standard output if not given.
+            module_path (str): Path used to name the program and resolve its relative imports.
+
+        Returns:
+            object: The value returned by the main function.
+
+        Notes:
+            - Raises a ValueError if the program has syntax errors or no main function.
+            - Errors raised while evaluating the program are raised by this coroutine.
+            - The program is parsed in its thread too, so parsing a large program does not block the event loop.
+        """
+        visitor = AsyncVisitor(interactive_mode=False, module_loader=ModuleLoader(), module_path=module_path)
+
+        def evaluate():
+            parser = parse_expression(source_code, module_path or "<input>")
+            tree = parser.root()
+            if parser.getNumberOfSyntaxErrors() != 0:
+                raise ValueError(f"{parser.getNumberOfSyntaxErrors()} syntax errors found.")
+
+            run_tree(tree, visitor, dry_run=True)
+            if "main" not in visitor.global_scope():
+                raise ValueError("No main function defined in the program.")
+            return visitor.call_function("main", visitor.global_scope()["main"], [])
+
+        loop = asyncio.get_running_loop()
+        program = ProgramThread(loop, self.steps_per_yield, evaluate)
+        request = None
+        value, error = None, None
+        finished = False
+        try:
+            while True:
+                async with self.running:
+                    request = program.start() if request is None else program.resume(value, error)
+                    try:
+                        kind, payload = await request
+                        finished = kind in ("done", "error")
+                    except asyncio.CancelledError:
+                        # Unwind the running program before another one can run
+                        program.cancel()
+                        await loop.run_in_executor(None, program.thread.join)
+                        raise
+
+                if program.output:
+                    text, program.output = "".join(program.output), []
+                    if output_sink is None:
+                        sys.stdout.write(text)
+                    else:
+                        await output_sink(text)
+
+                if kind == "done":
+                    return payload
+                if kind == "error":
+                    raise payload
+
+                value, error = None, None
+                if kind == "read":
+                    # The end of the input is signaled to the program as with the standard input
+                    try:
+                        if input_source is None:
+                            raise EOFError("No input source for 'read'.")
+                        value = await input_source()
+                    except EOFError as e:
+                        error = e
+        finally:
+            # Unwind the program if the task was cancelled or failed while the program was suspended
+            if not finished and program.thread.is_alive():
+                async with self.running:
+                    program.cancel()
+                    await loop.run_in_executor(None, program.thread.join)
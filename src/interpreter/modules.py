@@ -0,0 +1,367 @@
+import hashlib
+import os
+import pickle
+from antlr4 import InputStream
+from antlr4.Token import CommonToken
+from antlr4.tree.Tree import TerminalNodeImpl
+from build.schemeParser import schemeParser, serializedATN
+from interpreter.utilities import compile_program, run_tree, bind_owner
+from interpreter.builtins import define_builtins
+
+# Directory, next to each compiled file, where parse trees are cached between runs
+CACHE_DIRECTORY = "__schemecache__"
+
+# Identifies the grammar the cached parse trees were built with, so that regenerating the parser invalidates them
+GRAMMAR_DIGEST = hashlib.sha256(repr(serializedATN()).encode()).hexdigest()
+
+
+class Module:
+    """A Scheme source file loaded as a module with its own namespace."""
+
+    def __init__(self, path, digest, visitor):
+        """
+        Initialize a loaded module.
+
+        Args:
+            path (str): Absolute path of the module file.
+            digest (str): Content hash of the source the module was compiled from.
+            visitor (SchemeVisitor): The visitor holding the module's own symbol table.
+        """
+        self.path = path
+        self.digest = digest
+        self.visitor = visitor
+
+    @property
+    def dependencies(self):
+        """
+        Return the modules imported by this module.
+
+        Returns:
+            list: The `Module` instances this module depends on.
+        """
+        return self.visitor.imported_modules
+
+    @property
+    def exports(self):
+        """
+        Return the symbols defined by this module.
+
+        Built-in functions and symbols imported from other modules are not re-exported.
+        Functions are bound to the module's visitor so that their bodies are evaluated
+        in the module's namespace.
+
+        Returns:
+            dict: A dictionary mapping exported names to their values.
+        """
+        builtins = define_builtins()
+        return {
+            name: bind_owner(value, self.visitor)
+            for name, value in self.visitor.global_scope().items()
+            if name not in builtins and name not in self.visitor.imported_symbols
+        }
+
+
+class ModuleLoader:
+    """Loader that evaluates each module at most once and caches compiled modules by content hash."""
+
+    def __init__(self, persistent=True):
+        """
+        Initialize an empty loader.
+
+        Args:
+            persistent (bool): Whether parse trees are also cached on disk, in a `__schemecache__`
+                directory next to each compiled file, so that later runs do not parse them again.
+        """
+        self.persistent = persistent
+        self.modules = {}  # Loaded modules indexed by absolute path
+        self.compiled = {}  # Parse trees of the loaded modules indexed by the content hash of their source
+        self.loading = []  # Stack of modules being loaded, used to detect circular imports
+        self.checked = {}  # Staleness of the modules checked during the current run, indexed by path
+
+    def begin_run(self):
+        """
+        Start a new top-level program run, after which loaded modules are checked for changes again.
+        """
+        self.checked = {}
+
+    def load(self, path, importer):
+        """
+        Load a module, reusing the already loaded one if it is still up to date.
+
+        Args:
+            path (str): Absolute path of the module file.
+            importer (SchemeVisitor): The visitor importing the module.
+
+        Returns:
+            Module: The loaded module.
+
+        Notes:
+            - A module is recompiled only if its source changed; modules whose dependencies
+              were recompiled are re-evaluated from their cached parse tree.
+            - Each module is checked for changes at most once per run (see `begin_run`).
+            - Raises a ValueError if the module cannot be read or is imported circularly.
+        """
+        if path in self.loading:
+            raise ValueError(f"Circular import of module '{path}'.")
+
+        module = self.modules.get(path)
+        if module is not None and not self.is_stale(module):
+            return module
+
+        source_code = self.read_source(path)
+        digest = source_digest(source_code)
+        tree = self.compile(path, source_code, digest)
+
+        visitor = importer.module_visitor(path)
+        self.loading.append(path)
+        try:
+            run_tree(tree, visitor, dry_run=True)
+        finally:
+            self.loading.pop()
+
+        module = Module(path, digest, visitor)
+        self.modules[path] = module
+        self.checked[path] = False
+        # Modules still being loaded are not registered yet, so only evict after the outermost load
+        if not self.loading:
+            self.evict()
+        return module
+
+    def compile(self, path, source_code, digest=None):
+        """
+        Return the parse tree of a source file, parsing it only if no cached tree matches its contents.
+
+        Args:
+            path (str): Path of the source file.
+            source_code (str): The contents of the file.
+            digest (str): The content hash of the source, computed if not given.
+
+        Returns:
+            schemeParser.RootContext: The parse tree of the source.
+        """
+        digest = digest or source_digest(source_code)
+        if digest not in self.compiled:
+            tree = self.read_cache(path, source_code, digest) if self.persistent else None
+            if tree is None:
+                tree = compile_program(source_code, path)
+                if self.persistent:
+                    self.write_cache(path, digest, tree)
+            self.compiled[digest] = tree
+        return self.compiled[digest]
+
+    def is_stale(self, module):
+        """
+        Check whether a loaded module must be loaded again.
+
+        Results are kept until the next run, so that modules reachable through several imports
+        are only read once per run.
+
+        Args:
+            module (Module): The loaded module to check.
+
+        Returns:
+            bool: True if the module source changed or any of its dependencies was reloaded.
+        """
+        if module.path not in self.checked:
+            try:
+                stale = source_digest(self.read_source(module.path)) != module.digest
+            except ValueError:
+                stale = True
+
+            self.checked[module.path] = stale or any(
+                self.modules.get(dependency.path) is not dependency or self.is_stale(dependency)
+                for dependency in module.dependencies
+            )
+        return self.checked[module.path]
+
+    def evict(self):
+        """
+        Drop the cached parse trees that no loaded module was compiled from anymore.
+        """
+        digests = {module.digest for module in self.modules.values()}
+        for digest in list(self.compiled):
+            if digest not in digests:
+                del self.compiled[digest]
+
+    @staticmethod
+    def read_cache(path, source_code, digest):
+        """
+        Read the cached parse tree of a source file from disk.
+
+        Args:
+            path (str): Path of the source file.
+            source_code (str): The contents of the file.
+            digest (str): The content hash of the source.
+
+        Returns:
+            schemeParser.RootContext: The cached parse tree, or None if there is no usable one.
+        """
+        try:
+            with open(cache_path(path, digest), "rb") as f:
+                grammar_digest, tokens, tree = pickle.load(f)
+            if grammar_digest != GRAMMAR_DIGEST:
+                return None
+            return load_tree(tokens, tree, source_code, path)
+        except Exception:
+            # A missing, unreadable or outdated cache file is compiled again
+            return None
+
+    @staticmethod
+    def write_cache(path, digest, tree):
+        """
+        Write the parse tree of a source file to disk, replacing the trees of its previous versions.
+
+        Args:
+            path (str): Path of the source file.
+            digest (str): The content hash of the source.
+            tree (schemeParser.RootContext): The parse tree of the source.
+        """
+        target = cache_path(path, digest)
+        directory, name = os.path.split(target)
+        prefix = os.path.basename(path) + "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for other in os.listdir(directory):
+                version = other[len(prefix):-len(".pickle")]
+                if other != name and other.startswith(prefix) and other.endswith(".pickle") and "." not in version:
+                    os.remove(os.path.join(directory, other))
+
+            # Written to a temporary file first so that concurrent runs never read a partial tree
+            temporary = f"{target}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump((GRAMMAR_DIGEST, *dump_tree(tree)), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, target)
+        except OSError:
+            # The cache is an optimization only, e.g. the directory may be read-only
+            pass
+
+    @staticmethod
+    def read_source(path):
+        """
+        Read the source code of a module.
+
+        Args:
+            path (str): Path of the module file.
+
+        Returns:
+            str: The source code of the module.
+        """
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except OSError as e:
+            raise ValueError(f"Cannot read module file: {e.strerror}.")
+
+
+def source_digest(source_code):
+    """
+    Return the content hash used to identify a version of a source file.
+
+    Args:
+        source_code (str): The contents of the file.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the source.
+    """
+    return hashlib.sha256(source_code.encode()).hexdigest()
+
+
+def cache_path(path, digest):
+    """
+    Return the path of the file caching the parse tree of a version of a source file.
+
+    Args:
+        path (str): Path of the source file.
+        digest (str): The content hash of the source.
+
+    Returns:
+        str: The path of the cache file.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, CACHE_DIRECTORY, f"{name}.{digest}.pickle")
+
+
+def dump_tree(tree):
+    """
+    Convert a parse tree into plain tuples that can be serialized.
+
+    Args:
+        tree (schemeParser.RootContext): The parse tree.
+
+    Returns:
+        tuple: The list of tokens of the tree, as tuples of their fields, and the tree, as nested
+               `(context class name, invoking state, start token, stop token, children)` tuples in
+               which tokens are referred to by their index in the list and terminal nodes are token indexes.
+    """
+    tokens = []
+    indexes = {}
+
+    def token_index(token):
+        if token is None:
+            return -1
+        if id(token) not in indexes:
+            indexes[id(token)] = len(tokens)
+            tokens.append((
+                token.type, token.channel, token.start, token.stop,
+                token.tokenIndex, token.line, token.column, token._text,
+            ))
+        return indexes[id(token)]
+
+    def dump(ctx):
+        children = tuple(
+            token_index(child.symbol) if isinstance(child, TerminalNodeImpl) else dump(child)
+            for child in ctx.getChildren()
+        )
+        return type(ctx).__name__, ctx.invokingState, token_index(ctx.start), token_index(ctx.stop), children
+
+    return tokens, dump(tree)
+
+
+def load_tree(tokens, tree, source_code, source_name):
+    """
+    Rebuild a parse tree converted by `dump_tree`.
+
+    Args:
+        tokens (list): The tokens of the tree, as returned by `dump_tree`.
+        tree (tuple): The tree, as returned by `dump_tree`.
+        source_code (str): The source the tree was parsed from.
+        source_name (str): Name of the source, as given to `compile_program`.
+
+    Returns:
+        schemeParser.RootContext: The parse tree, equivalent to the one the parser would build.
+    """
+    input_stream = InputStream(source_code)
+    input_stream.name = source_name
+
+    # Objects are created without their constructors, which only initialize the fields set here
+    source = (None, input_stream)
+    symbols = []
+    for fields in tokens:
+        token = CommonToken.__new__(CommonToken)
+        token.source = source
+        (token.type, token.channel, token.start, token.stop,
+         token.tokenIndex, token.line, token.column, token._text) = fields
+        symbols.append(token)
+
+    def load(node, parent):
+        class_name, invoking_state, start, stop, children = node
+        context_class = getattr(schemeParser, class_name)
+        ctx = context_class.__new__(context_class)
+        ctx.parentCtx, ctx.invokingState, ctx.parser, ctx.exception = parent, invoking_state, None, None
+        ctx.start = symbols[start] if start >= 0 else None
+        ctx.stop = symbols[stop] if stop >= 0 else None
+        ctx.children = [load_child(child, ctx) for child in children] or None
+        return ctx
+
+    def load_child(child, parent):
+        if not isinstance(child, int):
+            return load(child, parent)
+        terminal = TerminalNodeImpl(symbols[child])
+        terminal.parentCtx = parent
+        return terminal
+
+    return load(tree, None)
+
+
+# Loader shared by every visitor so that each module is loaded at most once per process
+DEFAULT_LOADER = ModuleLoader()
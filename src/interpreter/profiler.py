@@ -0,0 +1,192 @@
+import json
+from time import perf_counter
+from interpreter.visitor import SchemeVisitor
+from build.schemeParser import schemeParser
+
+# Maximum length of the expression text shown in reports
+LABEL_LENGTH = 40
+
+
+class Profiler:
+    """Collector of evaluation counts and times per source location."""
+
+    def __init__(self):
+        """
+        Initialize an empty profile.
+        """
+        self.entries = {}  # [count, total_time, self_time, expression] indexed by (input stream, line, column)
+        self.child_times = []  # Stack with the time spent in the children of each running expression
+        self.active = {}  # Number of running evaluations of each expression, indexed like `entries`
+
+    def enter(self, ctx):
+        """
+        Mark the start of the evaluation of an expression.
+
+        Args:
+            ctx (schemeParser.ExprContext): The expression being evaluated.
+
+        Returns:
+            tuple: The location of the expression and the start time of the evaluation.
+        """
+        token = ctx.start
+        key = (token.getInputStream(), token.line, token.column)
+        self.active[key] = self.active.get(key, 0) + 1
+        self.child_times.append(0.0)
+        return key, perf_counter()
+
+    def exit(self, ctx, started):
+        """
+        Record the evaluation of an expression.
+
+        Args:
+            ctx (schemeParser.ExprContext): The evaluated expression.
+            started (tuple): The value returned by `enter`.
+        """
+        key, start = started
+        elapsed = perf_counter() - start
+        children_time = self.child_times.pop()
+        if self.child_times:
+            self.child_times[-1] += elapsed
+
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = [0, 0.0, 0.0, ctx]
+        entry[0] += 1
+        entry[2] += elapsed - children_time
+
+        # The total time of recursive evaluations is only counted once, by the outermost one
+        self.active[key] -= 1
+        if self.active[key] == 0:
+            entry[1] += elapsed
+
+    def records(self):
+        """
+        Return the collected measures, hottest expressions first.
+
+        Returns:
+            list: A list of dictionaries with the source, line, column and text of each expression,
+                  how many times it was evaluated and its total and self time in seconds.
+        """
+        records = [
+            {
+                "source": stream.name,
+                "line": line,
+                "column": column + 1,
+                "expression": expression_text(ctx),
+                "count": count,
+                "total_time": total_time,
+                "self_time": self_time,
+            }
+            for (stream, line, column), (count, total_time, self_time, ctx) in self.entries.items()
+        ]
+        return sorted(records, key=lambda record: record["self_time"], reverse=True)
+
+    def to_json(self):
+        """
+        Return the collected measures as a JSON document.
+
+        Returns:
+            str: The JSON dump of `records`.
+        """
+        return json.dumps({"expressions": self.records()}, indent=2)
+
+    def listing(self, top=10):
+        """
+        Return the profiled sources annotated with the counts and self time of each line.
+
+        Args:
+            top (int): Number of hottest expressions listed after the sources.
+
+        Returns:
+            str: The annotated listing.
+        """
+        lines_per_stream = {}
+        for (stream, line, _), (count, _, self_time, _) in self.entries.items():
+            line_counts = lines_per_stream.setdefault(stream, {})
+            line_count, line_time = line_counts.get(line, (0, 0.0))
+            line_counts[line] = (line_count + count, line_time + self_time)
+
+        output = []
+        for stream, line_counts in lines_per_stream.items():
+            output.append(f"== {stream.name} ==")
+            output.append(f"{'count':>10} {'self ms':>10} | source")
+            for number, source_line in enumerate(stream.strdata.splitlines(), start=1):
+                if number in line_counts:
+                    count, self_time = line_counts[number]
+                    output.append(f"{count:>10} {self_time * 1000:>10.3f} | {source_line}")
+                else:
+                    output.append(f"{'':>10} {'':>10} | {source_line}")
+            output.append("")
+
+        output.append(f"== Hottest expressions (top {top}) ==")
+        output.append(f"{'count':>10} {'self ms':>10} {'total ms':>10} | location: expression")
+        for record in self.records()[:top]:
+            output.append(
+                f"{record['count']:>10} {record['self_time'] * 1000:>10.3f} {record['total_time'] * 1000:>10.3f} | "
+                f"{record['source']}:{record['line']}:{record['column']}: {record['expression']}"
+            )
+        return "\n".join(output)
+
+
+class ProfilingVisitor(SchemeVisitor):
+    """Visitor that measures how many times and for how long each expression is evaluated."""
+
+    def __init__(self, interactive_mode=True, module_loader=None, module_path=None, profiler=None):
+        """
+        Initialize the visitor with the profiler collecting its measures.
+
+        Args:
+            interactive_mode (bool): Whether the interpreter runs in interactive mode or as a script.
+            module_loader (ModuleLoader): Loader used for 'import' expressions.
+            module_path (str): Path of the file being evaluated, used to resolve relative imports.
+            profiler (Profiler): Collector of the measures. A new one is created if not given.
+        """
+        self.profiler = profiler or Profiler()
+        super().__init__(interactive_mode, module_loader, module_path)
+
+    def module_visitor(self, module_path):
+        """
+        Create the visitor that evaluates a module, sharing this visitor's profiler.
+
+        Args:
+            module_path (str): Path of the module file.
+
+        Returns:
+            ProfilingVisitor: A non-interactive visitor sharing this visitor's loader and profiler.
+        """
+        return ProfilingVisitor(
+            interactive_mode=False, module_loader=self.module_loader, module_path=module_path, profiler=self.profiler
+        )
+
+    def visit(self, tree):
+        """
+        Visit a node, measuring it if it is an expression.
+
+        Returns:
+            object: The result of visiting the node.
+        """
+        if not isinstance(tree, schemeParser.ExprContext):
+            return tree.accept(self)
+
+        # Accepted directly rather than through super().visit, so that profiled programs use as many
+        # stack frames as unprofiled ones and reach the same recursion depth
+        started = self.profiler.enter(tree)
+        try:
+            return tree.accept(self)
+        finally:
+            self.profiler.exit(tree, started)
+
+
+def expression_text(ctx):
+    """
+    Return the source text of an expression on a single line.
+
+    Args:
+        ctx (schemeParser.ExprContext): The expression.
+
+    Returns:
+        str: The whitespace-normalized source of the expression, truncated to `LABEL_LENGTH` characters.
+    """
+    source = ctx.start.getInputStream().strdata[ctx.start.start:ctx.stop.stop + 1]
+    text = " ".join(source.split())
+    return text if len(text) <= LABEL_LENGTH else text[:LABEL_LENGTH - 3] + "..."
@@ -0,0 +1,176 @@
+class Promise:
+    """Memoizing promise created by 'delay' and evaluated by 'force'."""
+
+    def __init__(self, thunk):
+        """
+        Initialize an unforced promise.
+
+        Args:
+            thunk (callable): Function computing the value of the promise.
+        """
+        self.thunk = thunk
+        self.forced = False
+        self.value = None
+
+    def force(self):
+        """
+        Return the value of the promise, computing it the first time.
+
+        The thunk is released once forced so that it does not keep its environment alive.
+
+        Returns:
+            object: The value of the promise.
+        """
+        if not self.forced:
+            value = self.thunk()
+            # The thunk may have forced this promise itself
+            if not self.forced:
+                self.value, self.forced, self.thunk = value, True, None
+        return self.value
+
+
+class StreamPair:
+    """Stream node holding an evaluated first element and a promise of the rest of the stream."""
+
+    def __init__(self, car, cdr):
+        """
+        Initialize the stream node.
+
+        Args:
+            car (object): The first element of the stream.
+            cdr (Promise): Promise of the rest of the stream, another `StreamPair` or the empty list.
+        """
+        self.car = car
+        self.cdr = cdr
+
+    def rest(self):
+        """
+        Return the rest of the stream, forcing it if needed.
+
+        Returns:
+            StreamPair or list: The rest of the stream, or the empty list at its end.
+        """
+        return self.cdr.force()
+
+
+def check_stream(stream):
+    """
+    Check whether a value is a non-empty stream.
+
+    Args:
+        stream (object): The value to check.
+
+    Returns:
+        bool: True if the value is a `StreamPair`, False if it is the empty stream.
+
+    Notes:
+        - Raises a ValueError if the value is not a stream, e.g. a list given by mistake.
+    """
+    if isinstance(stream, StreamPair):
+        return True
+    if isinstance(stream, list) and not stream:
+        return False
+
+    # Imported here because the utilities module depends on this one
+    from interpreter.utilities import format_for_scheme
+    raise ValueError(f"Expected a stream, but got '{format_for_scheme(stream)}'.")
+
+
+def stream_from_iterator(iterator):
+    """
+    Create a stream reading its elements lazily from an iterator.
+
+    Args:
+        iterator (iterator): The iterator producing the elements.
+
+    Returns:
+        StreamPair or list: The stream, or the empty list if the iterator is exhausted.
+    """
+    for element in iterator:
+        return StreamPair(element, Promise(lambda: stream_from_iterator(iterator)))
+    return []
+
+
+def stream_elements(stream):
+    """
+    Iterate over the elements of a stream, forcing it as needed.
+
+    Args:
+        stream (StreamPair or list): The stream to iterate over.
+
+    Yields:
+        object: The elements of the stream.
+
+    Notes:
+        - Raises a ValueError if the value, or the rest of any of its elements, is not a stream.
+    """
+    while check_stream(stream):
+        yield stream.car
+        stream = stream.rest()
+
+
+def stream_map(call, function, stream):
+    """
+    Lazily apply a function to each element of a stream.
+
+    Args:
+        call (callable): Function applying a Scheme function to a list of arguments.
+        function (tuple): The Scheme function to apply.
+        stream (StreamPair or list): The stream to map.
+
+    Returns:
+        StreamPair or list: The mapped stream.
+
+    Notes:
+        - Raises a ValueError if the value is not a stream, here or when the rest of the stream is accessed.
+    """
+    if not check_stream(stream):
+        return []
+    return StreamPair(call(function, [stream.car]), Promise(lambda: stream_map(call, function, stream.rest())))
+
+
+def stream_filter(call, predicate, stream):
+    """
+    Lazily keep the elements of a stream that satisfy a predicate.
+
+    Elements are skipped iteratively, so long runs of rejected elements do not grow the stack.
+
+    Args:
+        call (callable): Function applying a Scheme function to a list of arguments.
+        predicate (tuple): The Scheme function deciding whether an element is kept.
+        stream (StreamPair or list): The stream to filter.
+
+    Returns:
+        StreamPair or list: The filtered stream.
+
+    Notes:
+        - Raises a ValueError if the value is not a stream, here or when the rest of the stream is accessed.
+    """
+    while check_stream(stream) and not call(predicate, [stream.car]):
+        stream = stream.rest()
+
+    if not check_stream(stream):
+        return []
+    return StreamPair(stream.car, Promise(lambda: stream_filter(call, predicate, stream.rest())))
+
+
+def stream_take(count, stream):
+    """
+    Lazily keep the first elements of a stream.
+
+    Args:
+        count (int): Number of elements to keep.
+        stream (StreamPair or list): The stream to take the elements from.
+
+    Returns:
+        StreamPair or list: A stream with at most `count` elements.
+
+    Notes:
+        - Raises a ValueError if the value is not a stream, here or when the rest of the stream is accessed.
+    """
+    if not check_stream(stream) or count <= 0:
+        return []
+    if count == 1:
+        # Do not force the rest of the stream, which may block on input
+        return StreamPair(stream.car, Promise(list))
+    return StreamPair(stream.car, Promise(lambda: stream_take(count - 1, stream.rest())))
@@ -1,6 +1,10 @@
 from antlr4 import InputStream, CommonTokenStream
 from build.schemeLexer import schemeLexer
 from build.schemeParser import schemeParser
+from interpreter.streams import Promise, StreamPair
+
+# Top-level forms evaluated when a program is run in dry-run mode
+DRY_RUN_KEYWORDS = ("define", "import")
 
 
 def format_for_scheme(value):
@@ -13,25 +17,58 @@ def format_for_scheme(value):
     Returns:
         str: The value formatted in Scheme style. Lists are converted to '( ... )', 
              booleans to '#t' or '#f', and other values to their string representation.
+             Streams are converted to '( ... )' with their already evaluated elements,
+             followed by '...' if the rest of the stream has not been evaluated yet.
     """
     if isinstance(value, list):
         return f"({' '.join(map(format_for_scheme, value))})"
+    if isinstance(value, StreamPair):
+        elements = []
+        while isinstance(value, StreamPair):
+            elements.append(format_for_scheme(value.car))
+            if not value.cdr.forced:
+                elements.append("...")
+                break
+            value = value.cdr.value
+        return f"({' '.join(elements)})"
+    if isinstance(value, Promise):
+        return "#<promise>"
     if isinstance(value, bool):
         return "#t" if value else "#f"
     return str(value)
 
 
-def parse_expression(expr_string):
+def bind_owner(value, owner):
+    """
+    Attach the visitor that owns a function to its symbol table entry.
+
+    Args:
+        value (any): A value stored in the symbol table.
+        owner (SchemeVisitor): The visitor whose symbol table the function body must be evaluated in.
+
+    Returns:
+        any: A `(parameters, body, owner)` tuple if the value is an unbound function,
+             otherwise the value itself.
+    """
+    if isinstance(value, tuple) and len(value) == 2:
+        return value + (owner,)
+    return value
+
+
+def parse_expression(expr_string, source_name="<input>"):
     """
     Parse a Scheme expression string into a parse tree.
 
     Args:
         expr_string (str): A string containing a Scheme expression.
+        source_name (str): Name of the source the expression comes from (e.g. its file path),
+            available from the parsed tokens through their input stream.
 
     Returns:
         schemeParser: An instance of the Scheme parser initialized with the provided expression.
     """
     input_stream = InputStream(expr_string)
+    input_stream.name = source_name
     lexer = schemeLexer(input_stream)
     lexer.removeErrorListeners()
     token_stream = CommonTokenStream(lexer)
@@ -40,7 +77,49 @@ def parse_expression(expr_string):
     return parser
 
 
-def run_program(source_code, visitor, dry_run=False):
+def compile_program(source_code, source_name="<input>"):
+    """
+    Parse a Scheme program and check it for syntax errors.
+
+    Args:
+        source_code (str): The source code of the Scheme program to compile.
+        source_name (str): Name of the source the program comes from (e.g. its file path).
+
+    Returns:
+        schemeParser.RootContext: The parse tree of the program.
+
+    Behavior:
+        - If syntax errors are found, prints the error count and parse tree, then exits.
+    """
+    parser = parse_expression(source_code, source_name)
+    tree = parser.root()
+    if parser.getNumberOfSyntaxErrors() != 0:
+        print(f"{parser.getNumberOfSyntaxErrors()} syntax errors found.")
+        print(tree.toStringTree(recog=parser))
+        exit(1)
+    return tree
+
+
+def run_tree(tree, visitor, dry_run=False):
+    """
+    Run an already compiled Scheme program.
+
+    Args:
+        tree (schemeParser.RootContext): The parse tree returned by `compile_program`.
+        visitor (SchemeVisitor): An instance of the Scheme visitor to evaluate the parse tree.
+
+        dry_run (bool): If True, only the top-level definitions and imports are evaluated.
+    """
+    if dry_run:
+        # Populate the symbol table without executing expressions
+        for child in tree.getChildren():
+            if hasattr(child, 'accept') and child.getChild(1).getText() in DRY_RUN_KEYWORDS:
+                child.accept(visitor)
+    else:
+        visitor.visit(tree)
+
+
+def run_program(source_code, visitor, dry_run=False, source_name="<input>"):
     """
     Run a Scheme program.
 
@@ -50,24 +129,14 @@ def run_program(source_code, visitor, dry_run=False):
         
         dry_run (bool): If True, the program will be parsed and the symbol table will be populated, 
          but expressions will not be executed.
+        source_name (str): Name of the source the program comes from (e.g. its file path).
 
     Behavior:
         - Parses the source code into a parse tree.
         - Checks for syntax errors in the source code.
         - If there are no syntax errors, visits the parse tree using the provided visitor.
         - If syntax errors are found, prints the error count and parse tree, then exits.
+        - Starts a new run of the visitor's module loader, so that imported modules are checked for changes again.
     """
-    parser = parse_expression(source_code)
-    tree = parser.root()
-    if parser.getNumberOfSyntaxErrors() == 0:
-        if dry_run:
-            # Populate the symbol table without executing expressions
-            for child in tree.getChildren():
-                if hasattr(child, 'accept') and child.getChild(1).getText() == "define":
-                    child.accept(visitor)
-        else:
-            visitor.visit(tree)
-    else:
-        print(f"{parser.getNumberOfSyntaxErrors()} syntax errors found.")
-        print(tree.toStringTree(recog=parser))
-        exit(1)
+    visitor.module_loader.begin_run()
+    run_tree(compile_program(source_code, source_name), visitor, dry_run)
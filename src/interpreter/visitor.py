@@ -1,5 +1,11 @@
-from interpreter.utilities import parse_expression, format_for_scheme
-from interpreter.builtins import define_builtins
+import os
+from functools import partial
+from interpreter.utilities import parse_expression, format_for_scheme, bind_owner
+from interpreter.modules import DEFAULT_LOADER
+from interpreter.streams import (
+    Promise, StreamPair, stream_from_iterator, stream_elements, stream_map, stream_filter, stream_take
+)
+from interpreter.builtins import compile_builtins
 from interpreter.operators import ARITHMETIC_OPERATIONS, RELATIONAL_OPERATIONS
 from build.schemeVisitor import schemeVisitor
 from functools import reduce
@@ -8,21 +14,38 @@ from functools import reduce
 class SchemeVisitor(schemeVisitor):
     """Visitor class for evaluating Scheme expressions."""
 
-    def __init__(self, interactive_mode=True):
+    def __init__(self, interactive_mode=True, module_loader=None, module_path=None):
         """
         Initialize the visitor with optional interactive mode.
 
         Args:
             interactive_mode (bool): Whether the interpreter runs in interactive mode or as a script.
+            module_loader (ModuleLoader): Loader used for 'import' expressions. Defaults to the
+                loader shared by the whole process.
+            module_path (str): Path of the file being evaluated, used to resolve relative imports.
+                Imports are resolved from the working directory if not given.
         """
         self.symbol_table = [{}]  # Stack of dictionaries for symbol table
         self.interactive_mode = interactive_mode  # Flag indicating interactive mode or .scm file mode
+        self.module_loader = module_loader or DEFAULT_LOADER
+        self.module_path = module_path
+        self.imported_modules = []  # Modules imported by this visitor
+        self.imported_symbols = {}  # Path of the module that bound each name imported in the global scope
 
         # Add built-in functions to memory
-        builtins = define_builtins()
-        for name, (params, body_string) in builtins.items():
-            body = parse_expression(body_string).expr()
-            self.current_scope()[name] = (params, [body])
+        self.current_scope().update(compile_builtins())
+
+    def module_visitor(self, module_path):
+        """
+        Create the visitor that evaluates a module imported by this visitor.
+
+        Args:
+            module_path (str): Path of the module file.
+
+        Returns:
+            SchemeVisitor: A non-interactive visitor sharing this visitor's module loader.
+        """
+        return type(self)(interactive_mode=False, module_loader=self.module_loader, module_path=module_path)
 
     def current_scope(self):
         """
@@ -60,7 +83,29 @@ class SchemeVisitor(schemeVisitor):
         if len(self.symbol_table) > 1:
             self.symbol_table.pop()
         else:
-            print("Error: Attempted to pop the global scope.")
+            self.write("Error: Attempted to pop the global scope.")
+
+    def write(self, *values, end="\n"):
+        """
+        Write values to the standard output.
+
+        Used for every output of the program (displayed values, results and errors) so that
+        subclasses can redirect it.
+
+        Args:
+            values (any): The values to write, separated by spaces.
+            end (str): The string written after the values.
+        """
+        print(*values, end=end)
+
+    def read_line(self):
+        """
+        Read a line from the standard input.
+
+        Returns:
+            str: The line read, without the trailing newline.
+        """
+        return input()
 
     def find_symbol(self, identifier):
         """
@@ -87,7 +132,7 @@ class SchemeVisitor(schemeVisitor):
         for expression in ctx.getChildren():
             result = self.visit(expression)
             if self.interactive_mode and result is not None:
-                print(format_for_scheme(result))
+                self.write(format_for_scheme(result))
 
     def visitConstantDefinitionExpr(self, ctx):
         """
@@ -104,7 +149,7 @@ class SchemeVisitor(schemeVisitor):
             value = self.visit(ctx.expr())
             self.current_scope()[identifier] = value
         except ValueError as e:
-            print(f"Error defining constant '{ctx.ID().getText()}': {e}")
+            self.write(f"Error defining constant '{ctx.ID().getText()}': {e}")
 
     def visitFunctionDefinitionExpr(self, ctx):
         """
@@ -122,7 +167,34 @@ class SchemeVisitor(schemeVisitor):
             body = list(ctx.expr())
             self.current_scope()[function_name] = (parameters, body)
         except ValueError as e:
-            print(f"Error defining function '{ctx.ID().getText()}': {e}")
+            self.write(f"Error defining function '{ctx.ID().getText()}': {e}")
+
+    def visitImportExpr(self, ctx):
+        """
+        Handle 'import' for modules.
+
+        Loads a Scheme file as a module and binds the symbols it defines in the current scope,
+        prefixed by '<prefix>-' if a prefix is given. Prints an error if the module cannot be
+        loaded or a symbol is already defined, unless it was bound by a previous import of the same module.
+        """
+        try:
+            path = ctx.STRING().getText().strip('"')
+            base_dir = os.path.dirname(self.module_path) if self.module_path else os.getcwd()
+            module = self.module_loader.load(os.path.abspath(os.path.join(base_dir, path)), self)
+            prefix = f"{ctx.ID().getText()}-" if ctx.ID() else ""
+
+            exports = {prefix + name: value for name, value in module.exports.items()}
+            # Checked before binding anything so that a failed import leaves the scope unchanged
+            for symbol in exports:
+                if symbol in self.current_scope() and self.imported_symbols.get(symbol) != module.path:
+                    raise ValueError(f"Symbol '{symbol}' is already defined in the current scope.")
+
+            self.current_scope().update(exports)
+            self.imported_symbols.update(dict.fromkeys(exports, module.path))
+
+            self.imported_modules.append(module)
+        except ValueError as e:
+            self.write(f"Error importing module {ctx.STRING().getText()}: {e}")
 
     def visitFunctionCallExpr(self, ctx):
         """
@@ -141,30 +213,58 @@ class SchemeVisitor(schemeVisitor):
             arguments = [self.visit(expr) for expr in ctx.expr()]
 
             find_symbol = self.find_symbol(function_name)
-            if find_symbol is not None:
-                parameters, body = find_symbol
-            else:
+            if find_symbol is None:
                 raise ValueError(f"Undefined function: '{function_name}'")
-            
-            # Check for parameter mismatch
-            if len(arguments) != len(parameters):
-                raise ValueError(
-                    f"Function '{function_name}' expects {len(parameters)} arguments, "
-                    f"but {len(arguments)} were provided."
-                )
-
-            # Create a new scope for the function call and match parameters to arguments
-            self.push_scope()
+
+            return self.call_function(function_name, find_symbol, arguments)
+        except ValueError as e:
+            self.write(f"Error calling function '{ctx.ID().getText()}': {e}")
+
+    def call_function(self, function_name, function, arguments):
+        """
+        Apply a function to already evaluated arguments.
+
+        Args:
+            function_name (str): Name the function was called with, used in error messages.
+            function (tuple): The function's parameters and body, and optionally the visitor owning it.
+            arguments (list): The evaluated arguments.
+
+        Returns:
+            object: The result of the last expression of the function body.
+
+        Notes:
+            - Functions owned by another visitor (e.g. imported from a module) are evaluated
+              in their owner's symbol table.
+            - Raises a ValueError if the argument count does not match.
+        """
+        if len(function) == 3:
+            parameters, body, owner = function
+            if owner is not self:
+                arguments = [bind_owner(argument, self) for argument in arguments]
+                result = owner.call_function(function_name, (parameters, body), arguments)
+                return bind_owner(result, owner)
+        else:
+            parameters, body = function
+
+        # Check for parameter mismatch
+        if len(arguments) != len(parameters):
+            raise ValueError(
+                f"Function '{function_name}' expects {len(parameters)} arguments, "
+                f"but {len(arguments)} were provided."
+            )
+
+        # Create a new scope for the function call and match parameters to arguments
+        self.push_scope()
+        try:
             self.current_scope().update(dict(zip(parameters, arguments)))
 
             result = None
             for expression in body:
                 result = self.visit(expression)
-
-            self.pop_scope()
             return result
-        except ValueError as e:
-            print(f"Error calling function '{ctx.ID().getText()}': {e}")
+        finally:
+            # Also pop the scope if the evaluation is interrupted (e.g. when a program is cancelled)
+            self.pop_scope()
 
     def visitIfExpr(self, ctx):
         """
@@ -178,6 +278,15 @@ class SchemeVisitor(schemeVisitor):
 
         return self.visit(branch)
 
+    def visitIfSingleExpr(self, ctx):
+        """
+        Evaluate single expression 'if' branches.
+
+        Returns:
+            object: The result of evaluating the expression.
+        """
+        return self.visit(ctx.expr())
+
     def visitIfBeginExpr(self, ctx):
         """
         Evaluate 'begin' blocks in 'if' branches.
@@ -300,6 +409,193 @@ class SchemeVisitor(schemeVisitor):
         lst = self.visit(ctx.expr())
         return not lst
 
+    def delay(self, ctx):
+        """
+        Create a promise evaluating an expression in the current environment.
+
+        Args:
+            ctx (schemeParser.ExprContext): The expression to delay.
+
+        Returns:
+            Promise: A promise evaluating the expression the first time it is forced.
+        """
+        # Function calls push their scope on top of the caller's ones, so the local scopes are
+        # merged to keep the environment of chained promises (e.g. streams) from growing
+        local_scope = {}
+        for scope in self.symbol_table[1:]:
+            local_scope.update(scope)
+        environment = [self.global_scope(), local_scope]
+
+        def evaluate():
+            symbol_table, self.symbol_table = self.symbol_table, list(environment)
+            try:
+                return self.visit(ctx)
+            finally:
+                self.symbol_table = symbol_table
+
+        return Promise(evaluate)
+
+    def apply(self, function_name, function, arguments):
+        """
+        Apply a function value to evaluated arguments, as done by the stream operations.
+
+        Args:
+            function_name (str): The expression the function was given as, used in error messages.
+            function (tuple): The function to apply.
+            arguments (list): The evaluated arguments.
+
+        Returns:
+            object: The result of the function call.
+        """
+        if not isinstance(function, tuple):
+            raise ValueError(f"Expected a function, but got '{format_for_scheme(function)}'.")
+        return self.call_function(function_name, function, arguments)
+
+    def visitDelayExpr(self, ctx):
+        """
+        Delay the evaluation of an expression.
+
+        Returns:
+            Promise: A memoizing promise of the expression's value.
+        """
+        return self.delay(ctx.expr())
+
+    def visitForceExpr(self, ctx):
+        """
+        Force a promise.
+
+        Returns:
+            object: The value of the promise, computed only the first time it is forced.
+            Values that are not promises are returned as they are.
+        """
+        value = self.visit(ctx.expr())
+        return value.force() if isinstance(value, Promise) else value
+
+    def visitStreamConsExpr(self, ctx):
+        """
+        Add an element to the beginning of a stream without evaluating the rest of the stream.
+
+        Returns:
+            StreamPair: A stream whose rest is evaluated the first time it is accessed.
+        """
+        element = self.visit(ctx.expr(0))
+        return StreamPair(element, self.delay(ctx.expr(1)))
+
+    def visitStreamCarExpr(self, ctx):
+        """
+        Return the first element of a stream.
+
+        Returns:
+            object: The first element of the stream, or None if the value is not a non-empty stream.
+        """
+        try:
+            stream = self.visit(ctx.expr())
+            if not isinstance(stream, StreamPair):
+                raise ValueError(f"Expected a non-empty stream, but got '{format_for_scheme(stream)}'.")
+            return stream.car
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-car' expression: {e}")
+
+    def visitStreamCdrExpr(self, ctx):
+        """
+        Return the stream except for the first element, evaluating it if needed.
+
+        Returns:
+            StreamPair or list: The rest of the stream, or None if the value is not a non-empty stream.
+        """
+        try:
+            stream = self.visit(ctx.expr())
+            if not isinstance(stream, StreamPair):
+                raise ValueError(f"Expected a non-empty stream, but got '{format_for_scheme(stream)}'.")
+            return stream.rest()
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-cdr' expression: {e}")
+
+    def visitStreamTakeExpr(self, ctx):
+        """
+        Return a stream with the first elements of a stream.
+
+        Returns:
+            StreamPair or list: A stream with at most the given number of elements, or None if the
+            second argument is not a stream.
+        """
+        try:
+            count = self.visit(ctx.expr(0))
+            return stream_take(count, self.visit(ctx.expr(1)))
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-take' expression: {e}")
+
+    def visitStreamMapExpr(self, ctx):
+        """
+        Apply a function to each element of a stream, as the elements are accessed.
+
+        Returns:
+            StreamPair or list: The mapped stream, or None if the arguments are not a function and a stream.
+        """
+        try:
+            function = self.visit(ctx.expr(0))
+            # The stream is not bound to a local so that its consumed elements can be released
+            return stream_map(partial(self.apply, ctx.expr(0).getText()), function, self.visit(ctx.expr(1)))
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-map' expression: {e}")
+
+    def visitStreamFilterExpr(self, ctx):
+        """
+        Keep the elements of a stream satisfying a predicate, as the elements are accessed.
+
+        Returns:
+            StreamPair or list: The filtered stream, or None if the arguments are not a function and a stream.
+        """
+        try:
+            predicate = self.visit(ctx.expr(0))
+            # The stream is not bound to a local so that its consumed elements can be released
+            return stream_filter(partial(self.apply, ctx.expr(0).getText()), predicate, self.visit(ctx.expr(1)))
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-filter' expression: {e}")
+
+    def visitStreamFromInputExpr(self, ctx):
+        """
+        Create a stream of the values read from the standard input until the end of the input.
+
+        Returns:
+            StreamPair or list: A stream reading each value the first time it is accessed.
+        """
+        def read_values():
+            while True:
+                try:
+                    yield self.read_value()
+                except EOFError:
+                    return
+
+        return stream_from_iterator(read_values())
+
+    def visitStreamToListExpr(self, ctx):
+        """
+        Convert a finite stream into a list.
+
+        Returns:
+            list: The elements of the stream, or None if evaluating the stream fails.
+        """
+        try:
+            return list(stream_elements(self.visit(ctx.expr())))
+        except ValueError as e:
+            self.write(f"Error evaluating 'stream-to-list' expression: {e}")
+
+    def visitListToStreamExpr(self, ctx):
+        """
+        Convert a list into a stream.
+
+        Returns:
+            StreamPair or list: A stream with the elements of the list, or None if the value is not a list.
+        """
+        try:
+            elements = self.visit(ctx.expr())
+            if not isinstance(elements, list):
+                raise ValueError(f"Expected a list, but got '{format_for_scheme(elements)}'.")
+            return stream_from_iterator(iter(elements))
+        except ValueError as e:
+            self.write(f"Error evaluating 'list-to-stream' expression: {e}")
+
     def visitLetExpr(self, ctx):
         """
         Evaluate 'let' expressions.
@@ -310,9 +606,8 @@ class SchemeVisitor(schemeVisitor):
         Notes:
             - If a variable is already defined in the current scope, an error is printed.
         """
+        self.push_scope()  # Create a new scope for the 'let' expression
         try:
-            self.push_scope()  # Create a new scope for the 'let' expression
-
             for binding in ctx.letBinding():
                 identifier = binding.ID().getText()
 
@@ -322,11 +617,11 @@ class SchemeVisitor(schemeVisitor):
                 value = self.visit(binding.expr())
                 self.current_scope()[identifier] = value
 
-            result = [self.visit(expression) for expression in ctx.expr()]
-            self.pop_scope()  # Remove the scope after evaluating the 'let' expression
-            return result
+            return [self.visit(expression) for expression in ctx.expr()]
         except ValueError as e:
-            print(f"Error evaluating 'let' expression: {e}")
+            self.write(f"Error evaluating 'let' expression: {e}")
+        finally:
+            self.pop_scope()  # Remove the scope after evaluating the 'let' expression
 
     def visitDisplayExpr(self, ctx):
         """
@@ -335,7 +630,7 @@ class SchemeVisitor(schemeVisitor):
         Prints the evaluated expression in Scheme-style format to the standard output.
         """
         value = self.visit(ctx.expr())
-        print(format_for_scheme(value), end="")
+        self.write(format_for_scheme(value), end="")
 
     def visitReadExpr(self, ctx):
         """
@@ -344,10 +639,21 @@ class SchemeVisitor(schemeVisitor):
         Returns:
             object: The parsed input as an int, float, or string.
         """
-        value = input().strip()
+        return self.read_value()
+
+    def read_value(self):
+        """
+        Read a value from the standard input.
+
+        Returns:
+            object: The parsed input as a list, an int, a float, or a string.
+        """
+        value = self.read_line().strip()
 
         if value.startswith("'(") and value.endswith(")"):
-            return self.visit(parse_expression(value).expr())
+            # Parsed as a literal rather than an expression, so that visitors instrumenting
+            # expressions (e.g. the profiler) do not measure the values read from the input
+            return self.visit(parse_expression(value).literal())
 
         try:
             return float(value) if "." in value else int(value)
@@ -360,7 +666,7 @@ class SchemeVisitor(schemeVisitor):
 
         Prints a newline character to the console.
         """
-        print()
+        self.write()
 
     def visitQuotedListExpr(self, ctx):
         """
@@ -417,5 +723,5 @@ class SchemeVisitor(schemeVisitor):
             else:
                 raise ValueError(f"Undefined identifier: '{identifier}'")
         except ValueError as e:
-            print(f"Error evaluating identifier '{ctx.getText()}': {e}")
+            self.write(f"Error evaluating identifier '{ctx.getText()}': {e}")
 
@@ -1,32 +1,66 @@
 import argparse
+import sys
 from interpreter.visitor import SchemeVisitor
-from interpreter.utilities import run_program
+from interpreter.profiler import ProfilingVisitor, Profiler
+from interpreter.utilities import run_program, run_tree
 
 
-def execute_file(file_path):
+def execute_file(file_path, profiler=None):
     """
     Execute a Scheme program from a file.
 
     Args:
         file_path (str): Path to the Scheme program file.
+        profiler (Profiler): If given, the program is evaluated by a `ProfilingVisitor` collecting
+            its measures in this profiler.
 
-    First, the program is read from the file and executed in dry-run mode to populate the symbol table.
+    First, the program is read from the file and executed in dry-run mode to populate the symbol table
+    and load the imported modules, which are resolved relative to the file's directory. The parse trees
+    of the program and its modules are cached on disk, so unchanged files are not parsed again.
     Then, the main function is executed if it is defined in the program.
     """
-    visitor = SchemeVisitor(interactive_mode=False)
+    if profiler is None:
+        visitor = SchemeVisitor(interactive_mode=False, module_path=file_path)
+    else:
+        visitor = ProfilingVisitor(interactive_mode=False, module_path=file_path, profiler=profiler)
 
     with open(file_path, "r") as f:
         source_code = f.read()
 
-    run_program(source_code, visitor, dry_run=True)
+    visitor.module_loader.begin_run()
+    run_tree(visitor.module_loader.compile(file_path, source_code), visitor, dry_run=True)
 
     if "main" in visitor.global_scope():
-        run_program("(main)", visitor)
+        # Called directly instead of evaluating a "(main)" program, which would show up in profiles
+        try:
+            visitor.call_function("main", visitor.global_scope()["main"], [])
+        except ValueError as e:
+            print(f"Error calling function 'main': {e}")
     else:
         print(f"Error: No main function defined in file {file_path}")
         exit(1)
 
 
+def profile_file(file_path, listing, json_path):
+    """
+    Execute a Scheme program from a file, measuring the evaluation of each expression.
+
+    Args:
+        file_path (str): Path to the Scheme program file.
+        listing (bool): Whether to print the annotated source listing to stderr.
+        json_path (str): Path of the JSON file to write the measures to, if any.
+    """
+    profiler = Profiler()
+    try:
+        execute_file(file_path, profiler)
+    finally:
+        if listing:
+            print(profiler.listing(), file=sys.stderr)
+        if json_path:
+            with open(json_path, "w") as f:
+                f.write(profiler.to_json())
+
+
 def interactive_mode():
     """
     Start the interpreter in interactive mode.
@@ -53,10 +87,24 @@ def main():
         help="Scheme program file to execute (.scm)",
         default=None
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the source annotated with evaluation counts and times per line to stderr"
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Write the evaluation counts and times per expression to a JSON file",
+        default=None
+    )
     args = parser.parse_args()
 
     if args.file:
-        execute_file(args.file)
+        if args.profile or args.profile_json:
+            profile_file(args.file, args.profile, args.profile_json)
+        else:
+            execute_file(args.file)
     else:
         interactive_mode()
 
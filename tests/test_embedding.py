@@ -0,0 +1,207 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from interpreter.embedding import AsyncInterpreter  # noqa: E402
+from interpreter.utilities import parse_expression, run_program  # noqa: E402
+from interpreter.visitor import SchemeVisitor  # noqa: E402
+
+COUNTER = """
+(define (count-down n)
+    (if (= n 0)
+        0
+        (begin
+            (display n)
+            (newline)
+            (count-down (- n 1)))))
+
+(define (main)
+    (count-down 5)
+    (display (read))
+    (read))
+"""
+
+WORK_MODULE = """
+(define (count n)
+    (if (= n 0)
+        0
+        (+ 1 (count (- n 1)))))
+
+(define (work tag n)
+    (cons tag (cons (count n) '())))
+"""
+
+WORK = """
+(import "work.scm")
+
+(define (main)
+    (work (read) 30))
+"""
+
+FIB = """
+(define (fib n)
+    (if (< n 2)
+        n
+        (+ (fib (- n 1)) (fib (- n 2)))))
+
+(define (main)
+    (fib 40))
+"""
+
+DEEP = """
+(define (depth n)
+    (if (= n 0)
+        0
+        (+ 1 (depth (- n 1)))))
+
+(define (main)
+    (depth 60))
+"""
+
+# Program with many definitions, which takes a noticeable time to parse
+LARGE = "\n".join(f"(define (f{i} x) (if (< x 2) x (+ (f{i} (- x 1)) {i})))" for i in range(300)) + "\n(define (main) 1)"
+
+
+def source(lines):
+    """Return an async input source reading from a list of lines."""
+    lines = iter(lines)
+
+    async def read():
+        await asyncio.sleep(0)
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError()
+
+    return read
+
+
+class AsyncInterpreterTest(unittest.TestCase):
+    """Tests for running programs concurrently in an event loop."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "work.scm"), "w") as f:
+            f.write(WORK_MODULE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_concurrent_programs(self):
+        chunks = []
+
+        def sink(name):
+            async def write(text):
+                chunks.append((name, text))
+            return write
+
+        async def main():
+            interpreter = AsyncInterpreter(steps_per_yield=5)
+            return await asyncio.gather(
+                interpreter.run(COUNTER, source(["a", "1"]), sink("a")),
+                interpreter.run(COUNTER, source(["b", "2"]), sink("b")),
+            )
+
+        self.assertEqual(asyncio.run(main()), [1, 2])
+        for name in ("a", "b"):
+            output = "".join(text for chunk_name, text in chunks if chunk_name == name)
+            self.assertEqual(output, f"5\n4\n3\n2\n1\n{name}")
+
+        # Both programs made progress before either of them finished
+        names = [name for name, _ in chunks]
+        self.assertLess(names.index("b"), len(names) - 1 - names[::-1].index("a"))
+
+    def test_programs_using_the_same_module(self):
+        async def main():
+            interpreter = AsyncInterpreter(steps_per_yield=7)
+            path = os.path.join(self.directory.name, "main.scm")
+            return await asyncio.gather(
+                interpreter.run(WORK, source(["1"]), module_path=path),
+                interpreter.run(WORK, source(["2"]), module_path=path),
+            )
+
+        self.assertEqual(asyncio.run(main()), [[1, 30], [2, 30]])
+
+    def test_read_without_input(self):
+        async def main():
+            return await AsyncInterpreter().run(COUNTER, source([]), self.discard)
+
+        with self.assertRaises(EOFError):
+            asyncio.run(main())
+
+    def test_cancellation(self):
+        async def main():
+            interpreter = AsyncInterpreter(steps_per_yield=50)
+            task = asyncio.create_task(interpreter.run(FIB))
+
+            # The event loop keeps running other tasks while the program runs
+            ticks = 0
+            for _ in range(20):
+                await asyncio.sleep(0)
+                ticks += 1
+
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            # Other programs can still run after a cancellation
+            path = os.path.join(self.directory.name, "main.scm")
+            return ticks, await interpreter.run(WORK, source(["3"]), module_path=path)
+
+        self.assertEqual(asyncio.run(main()), (20, [3, 30]))
+
+        # The thread of the cancelled program has been unwound (finished threads may still be exiting)
+        for thread in threading.enumerate():
+            if thread.name.startswith("Thread-"):
+                thread.join(timeout=5)
+                self.assertFalse(thread.is_alive())
+
+    def test_parsing_does_not_block_the_event_loop(self):
+        start = time.perf_counter()
+        parse_expression(LARGE).root()
+        parse_time = time.perf_counter() - start
+
+        async def main():
+            task = asyncio.create_task(AsyncInterpreter().run(LARGE))
+            longest_pause, last = 0.0, time.perf_counter()
+            while not task.done():
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                longest_pause, last = max(longest_pause, now - last), now
+            return await task, longest_pause
+
+        result, longest_pause = asyncio.run(main())
+        self.assertEqual(result, 1)
+        self.assertLess(longest_pause, parse_time / 2)
+
+    def test_syntax_errors(self):
+        async def main():
+            return await AsyncInterpreter().run("(define (main) (display 1)")
+
+        with self.assertRaisesRegex(ValueError, "syntax errors"):
+            asyncio.run(main())
+
+    def test_recursion_depth_is_the_same_as_in_the_cli(self):
+        self.assertEqual(asyncio.run(AsyncInterpreter().run(DEEP)), 60)
+
+    def test_interrupted_calls_pop_their_scopes(self):
+        visitor = SchemeVisitor(interactive_mode=False)
+        run_program("(define (first x) (let ((y x)) (car y)))", visitor, dry_run=True)
+
+        with self.assertRaises(TypeError):
+            run_program("(first 5)", visitor)
+        self.assertEqual(len(visitor.symbol_table), 1)
+
+    @staticmethod
+    async def discard(text):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+(import "modules/math.scm")
+(import "modules/lists.scm" lists)
+
+(define (add1 x)
+    (+ x 1)
+)
+
+(define (main)
+    (define n (read))
+    (display (scale n))
+    (newline)
+    (display (square factor))
+    (newline)
+    (display (lists-sum-squares '(1 2 3)))
+    (newline)
+    (display (lists-apply-all add1 '(1 2 3)))
+    (newline)
+    (display (map scale '(1 2 3)))
+    (newline)
+    (display (lists-sum '(1 2 3 4)))
+)
@@ -0,0 +1,16 @@
+(import "math.scm" m)
+
+(define (sum lst)
+    (if (null? lst)
+        0
+        (+ (car lst) (sum (cdr lst)))
+    )
+)
+
+(define (sum-squares lst)
+    (sum (map m-square lst))
+)
+
+(define (apply-all f lst)
+    (map f lst)
+)
@@ -0,0 +1,9 @@
+(define factor 3)
+
+(define (scale x)
+    (* x factor)
+)
+
+(define (square x)
+    (* x x)
+)
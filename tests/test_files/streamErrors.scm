@@ -0,0 +1,15 @@
+(define (square x)
+    (* x x)
+)
+
+(define (main)
+    (stream-map square '(1 2 3))
+    (stream-filter square 5)
+    (stream-take 2 '(1 2 3))
+    (stream-to-list 5)
+    (stream-to-list (stream-cons 1 5))
+    (list-to-stream 5)
+    (display (stream-to-list (stream-map square (list-to-stream '(1 2 3)))))
+    (newline)
+    (display (stream-to-list (stream-take 2 '())))
+)
@@ -0,0 +1,38 @@
+(define (integers-from n)
+    (stream-cons n (integers-from (+ n 1)))
+)
+
+(define (even x)
+    (= (mod x 2) 0)
+)
+
+(define (square x)
+    (* x x)
+)
+
+(define (noisy)
+    (display "computed ")
+    7
+)
+
+(define (over-5000 x)
+    (> x 5000)
+)
+
+(define (main)
+    (define nat (integers-from 0))
+    (display (stream-to-list (stream-take 5 nat)))
+    (newline)
+    (display nat)
+    (newline)
+    (display (stream-to-list (stream-take 4 (stream-map square (stream-filter even nat)))))
+    (newline)
+    (display (stream-car (stream-cdr (list-to-stream '(1 2 3)))))
+    (newline)
+    (define p (delay (noisy)))
+    (display (+ (force p) (force p)))
+    (newline)
+    (display (stream-car (stream-filter over-5000 (integers-from 0))))
+    (newline)
+    (display (stream-to-list (stream-filter even (stream-from-input))))
+)
@@ -0,0 +1,123 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from interpreter.modules import CACHE_DIRECTORY, ModuleLoader  # noqa: E402
+from interpreter.utilities import run_program  # noqa: E402
+from interpreter.visitor import SchemeVisitor  # noqa: E402
+
+
+class ModuleLoaderTest(unittest.TestCase):
+    """Tests for loading, caching and reloading modules."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.loader = ModuleLoader()
+        self.visitor = SchemeVisitor(
+            interactive_mode=True,
+            module_loader=self.loader,
+            module_path=os.path.join(self.directory.name, "main.scm"),
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_module(self, name, source_code):
+        with open(self.path(name), "w") as f:
+            f.write(source_code)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def evaluate(self, source_code):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            run_program(source_code, self.visitor)
+        return output.getvalue()
+
+    def test_module_is_loaded_once(self):
+        self.write_module("a.scm", "(define (f x) (* x 2))")
+        self.write_module("b.scm", '(import "a.scm")\n(define (g x) (f x))')
+
+        self.assertEqual(self.evaluate('(import "a.scm") (import "b.scm" b) (b-g 3)'), "6\n")
+        module = self.loader.modules[self.path("a.scm")]
+
+        self.evaluate('(import "a.scm")')
+        self.assertIs(self.loader.modules[self.path("a.scm")], module)
+        self.assertIs(self.loader.modules[self.path("b.scm")].dependencies[0], module)
+        self.assertEqual(len(self.loader.compiled), 2)
+
+    def test_changed_module_and_dependents_are_reloaded(self):
+        self.write_module("a.scm", "(define (f x) (* x 2))")
+        self.write_module("b.scm", '(import "a.scm")\n(define (g x) (f x))')
+        self.write_module("c.scm", "(define (h) 1)")
+        self.evaluate('(import "b.scm") (import "c.scm")')
+        modules = dict(self.loader.modules)
+        compiled = dict(self.loader.compiled)
+
+        self.write_module("a.scm", "(define (f x) (* x 10))")
+        self.assertEqual(self.evaluate('(import "b.scm") (import "c.scm") (g 3)'), "30\n")
+
+        # Only the changed module is compiled again, its dependent is re-evaluated from its cached tree
+        self.assertIsNot(self.loader.modules[self.path("a.scm")], modules[self.path("a.scm")])
+        self.assertIsNot(self.loader.modules[self.path("b.scm")], modules[self.path("b.scm")])
+        self.assertIs(self.loader.modules[self.path("c.scm")], modules[self.path("c.scm")])
+        b_digest = self.loader.modules[self.path("b.scm")].digest
+        self.assertIs(self.loader.compiled[b_digest], compiled[b_digest])
+
+        # The parse tree of the previous version of the module is evicted
+        self.assertNotIn(modules[self.path("a.scm")].digest, self.loader.compiled)
+        self.assertEqual(len(self.loader.compiled), 3)
+
+    def test_modules_are_checked_once_per_run(self):
+        self.write_module("a.scm", "(define (f x) (* x 2))")
+        self.write_module("b.scm", '(import "a.scm")\n(define (g x) (f x))')
+
+        with mock.patch.object(self.loader, "read_source", wraps=ModuleLoader.read_source) as read_source:
+            self.evaluate('(import "b.scm") (import "a.scm") (import "b.scm")')
+            self.assertEqual(read_source.call_count, 2)
+
+            self.evaluate('(import "b.scm") (import "a.scm") (import "b.scm")')
+            self.assertEqual(read_source.call_count, 4)
+
+    def test_parse_trees_are_cached_on_disk(self):
+        self.write_module("a.scm", "(define (f x) (* x 2))")
+        self.evaluate('(import "a.scm")')
+
+        self.write_module("a.scm", "(define (f x) (* x 3))")
+        self.evaluate('(import "a.scm")')
+        # Only the tree of the current version of the module is kept
+        self.assertEqual(len(os.listdir(self.path(CACHE_DIRECTORY))), 1)
+
+        # A new loader, as in a new process, does not parse the module again
+        with mock.patch("interpreter.modules.compile_program") as compile_program:
+            self.visitor = SchemeVisitor(interactive_mode=True, module_loader=ModuleLoader(),
+                                         module_path=self.path("main.scm"))
+            self.assertEqual(self.evaluate('(import "a.scm") (f 2)'), "6\n")
+            compile_program.assert_not_called()
+
+    def test_symbol_defined_by_two_modules(self):
+        self.write_module("a.scm", "(define (f) 1) (define (g) 1)")
+        self.write_module("b.scm", "(define (g) 2) (define (f) 2)")
+
+        output = self.evaluate('(import "a.scm") (import "b.scm") (f) (g)')
+        self.assertEqual(output, "Error importing module \"b.scm\": Symbol 'g' is already defined in the current scope.\n1\n1\n")
+
+    def test_circular_import(self):
+        self.write_module("a.scm", '(import "b.scm")')
+        self.write_module("b.scm", '(import "a.scm")')
+
+        self.assertIn("Circular import of module", self.evaluate('(import "a.scm")'))
+
+    def test_missing_module(self):
+        self.assertIn("Cannot read module file", self.evaluate('(import "missing.scm")'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INTERPRETER = os.path.join(ROOT, "src", "scheme.py")
+
+PROGRAM = """(define (fact n)
+    (if (= n 0)
+        1
+        (* n (fact (- n 1)))))
+
+(define (main)
+    (display (fact 5)))
+"""
+
+
+READER = """(define (main)
+    (display (read))
+    (display (stream-to-list (stream-from-input))))
+"""
+
+DEEP = """(define (depth n)
+    (if (= n 0)
+        0
+        (+ 1 (depth (- n 1)))))
+
+(define (main)
+    (display (depth 60)))
+"""
+
+
+def profile(directory, source_code, input_text="", *options):
+    """Write a program to a file and run it with the --profile option."""
+    scheme_file = os.path.join(directory, "program.scm")
+    with open(scheme_file, "w") as f:
+        f.write(source_code)
+    return subprocess.run(
+        [sys.executable, INTERPRETER, scheme_file, "--profile", *options],
+        input=input_text,
+        text=True,
+        capture_output=True,
+    )
+
+
+class ProfilerTest(unittest.TestCase):
+    """Tests for the --profile and --profile-json options."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.scheme_file = os.path.join(self.directory.name, "fact.scm")
+        self.json_file = os.path.join(self.directory.name, "profile.json")
+        with open(self.scheme_file, "w") as f:
+            f.write(PROGRAM)
+
+        self.result = subprocess.run(
+            [sys.executable, INTERPRETER, self.scheme_file, "--profile", "--profile-json", self.json_file],
+            text=True,
+            capture_output=True,
+        )
+        with open(self.json_file) as f:
+            self.records = json.load(f)["expressions"]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, line, column):
+        return next(r for r in self.records if (r["line"], r["column"]) == (line, column))
+
+    def test_program_output_is_unchanged(self):
+        self.assertEqual(self.result.stdout, "120")
+
+    def test_json_structure(self):
+        keys = {"source", "line", "column", "expression", "count", "total_time", "self_time"}
+        for record in self.records:
+            self.assertEqual(set(record), keys)
+            self.assertEqual(record["source"], self.scheme_file)
+
+    def test_counts(self):
+        self.assertEqual(self.record(2, 5)["count"], 6)  # (if (= n 0) ...)
+        self.assertEqual(self.record(2, 9)["count"], 6)  # (= n 0)
+        self.assertEqual(self.record(4, 9)["count"], 5)  # (* n (fact (- n 1)))
+        self.assertEqual(self.record(7, 5)["count"], 1)  # (display (fact 5))
+        self.assertEqual(self.record(2, 5)["expression"], "(if (= n 0) 1 (* n (fact (- n 1))))")
+
+    def test_recursive_total_time_is_not_counted_twice(self):
+        main_total = self.record(7, 5)["total_time"]
+        for record in self.records:
+            self.assertLessEqual(record["total_time"], main_total)
+            self.assertLessEqual(record["self_time"], record["total_time"])
+
+    def test_listing(self):
+        self.assertIn(f"== {self.scheme_file} ==", self.result.stderr)
+        self.assertNotIn("<input>", self.result.stderr)
+        # Counts are summed over the expressions starting on each line: (if ...), (= n 0), n and 0
+        self.assertRegex(self.result.stderr, r"\s+24\s+\d+\.\d{3} \|     \(if \(= n 0\)")
+
+    def test_values_read_from_input_are_not_profiled(self):
+        json_file = os.path.join(self.directory.name, "reader.json")
+        result = profile(self.directory.name, READER, "'(1 2)\n'(3 4)\n'(5)\n", "--profile-json", json_file)
+
+        self.assertEqual(result.stdout, "(1 2)((3 4) (5))")
+        self.assertNotIn("<input>", result.stderr)
+        with open(json_file) as f:
+            sources = {record["source"] for record in json.load(f)["expressions"]}
+        self.assertEqual(sources, {os.path.join(self.directory.name, "program.scm")})
+
+    def test_profiling_does_not_reduce_the_recursion_depth(self):
+        self.assertEqual(profile(self.directory.name, DEEP).stdout, "60")
+
+
+if __name__ == "__main__":
+    unittest.main()